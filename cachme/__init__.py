@@ -26,6 +26,7 @@ computations and requesting frequently accessed content, and to improve performa
 This exports:
   - cache is the function decorator
   - BaseCache is an abstract class other caching classes derive from
+  - ClockCache is a CLOCK approximation of a Least Recently Used cache
   - FIFOCache is a First-in First-out cache
   - LIFOCache is a Last-in First-out cache
   - LFUCache is a Least Frequently Used cache
@@ -43,20 +44,24 @@ This exports:
 """
 
 
-__all__ = ['cache', 'BaseCache', 'FIFOCache', 'LIFOCache', 'LFUCache', 'LRUCache', 'MFUCache', 'MQCache', 'MRUCache',
-           'NMRUCache', 'RRCache', 'SLRUCache', 'StaticCache', 'TLRUCache', 'TwoQCache', 'TwoQFullCache']
+__all__ = ['cache', 'BaseCache', 'ClockCache', 'FIFOCache', 'LIFOCache', 'LFUCache', 'LRUCache', 'MFUCache', 'MQCache',
+           'MRUCache', 'NMRUCache', 'RRCache', 'SLRUCache', 'StaticCache', 'TLRUCache', 'TwoQCache', 'TwoQFullCache']
 
 
 from abc import ABC, abstractmethod
-from collections import namedtuple, deque
+from collections import namedtuple, OrderedDict
 from inspect import signature, Parameter
 from functools import wraps
-from threading import RLock
-from time import time
+from threading import Lock
+from time import monotonic
+from weakref import WeakKeyDictionary
 import math
+import random
+import sys
 
 
 _CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'current_size', 'max_size'])
+_sentinel = object()
 
 
 class _FunctionSignature:
@@ -66,13 +71,44 @@ class _FunctionSignature:
     KWARGS = 1 << 2
 
 
+_PARAMETER_FLAGS = {
+    Parameter.POSITIONAL_ONLY: _FunctionSignature.NORMAL,
+    Parameter.POSITIONAL_OR_KEYWORD: _FunctionSignature.NORMAL,
+    Parameter.VAR_POSITIONAL: _FunctionSignature.ARGS,
+    Parameter.VAR_KEYWORD: _FunctionSignature.KWARGS,
+}
+
+
+def _function_signature(func):
+    sig = 0
+
+    for param in signature(func).parameters.values():
+        sig |= _PARAMETER_FLAGS.get(param.kind, 0)
+
+    return sig or None
+
+
+# Callbacks are often shared between decorated functions, so avoid re-inspecting their signatures. Callbacks are
+# weakly referenced so the cache never keeps them, or the instances of bound methods, alive.
+_function_signatures = WeakKeyDictionary()
+
+
+def _cached_function_signature(func):
+    try:
+        return _function_signatures[func]
+    except KeyError:
+        sig = _function_signatures[func] = _function_signature(func)
+        return sig
+
+
 class cache:
     """Function caching decorator.
 
     Wraps a function and caches successive calls with the same given parameters and optional typing information.
 
     Different caching algorithms can be utilized, those of which extend the provided `BaseCache` class. Each
-    implementation is thread-safe and all current implementations are O(1) for insertions and accesses.
+    implementation is thread-safe unless created with `thread_safe=False`, and all current implementations are O(1) for
+    insertions and accesses.
 
     The cache can be cleared via the `cache_clear` function and caching information can be retrieved from the function
     by calling `cache_info`. The following properties are returned in a namedtuple `CacheInfo`:
@@ -106,18 +142,36 @@ class cache:
         A callable function to manipulate the arguments and keyword arguments being used to create the cache key. Should
         accept the same arguments and parameters as the calling function and return a tuple of the arguments and keyword
         arguments to use to create the cache key.
+    :param on_hit_every:
+        Only call `on_hit` on every Nth cache hit of the decorated function. Hits are counted per decorated function,
+        so direct `get` calls and other functions sharing the algorithm don't affect when it is called. Defaults to 1.
+    :param on_miss_every:
+        Only call `on_miss` on every Nth cache miss of the decorated function, counted as with `on_hit_every`.
+        Defaults to 1.
     :type algorithm: BaseCache
     :type include_types: bool
     :type on_hit: callable
     :type on_miss: callable
     :type key_func: callable
+    :type on_hit_every: int
+    :type on_miss_every: int
     """
-    def __init__(self, algorithm, include_types=False, on_hit=None, on_miss=None, key_func=None):
+    # Dynamic methods from the algorithm are bound under `__dict__`
+    __slots__ = ['algorithm', 'include_types', 'on_hit', 'on_miss', 'key_func', 'on_hit_every', 'on_miss_every',
+                 '_sig_hit', '_sig_miss', '_invoke_hit', '_invoke_miss', '__dict__']
+
+    def __init__(self, algorithm, include_types=False, on_hit=None, on_miss=None, key_func=None, on_hit_every=1,
+                 on_miss_every=1):
         self.algorithm = algorithm
         self.include_types = include_types
         self.on_hit = on_hit
         self.on_miss = on_miss
         self.key_func = key_func
+        self.on_hit_every = on_hit_every
+        self.on_miss_every = on_miss_every
+
+        # Validate parameters
+        self._validations()
 
         # Dynamic methods
         for method in algorithm.dynamic_methods:
@@ -127,11 +181,39 @@ class cache:
         self._sig_hit = None if not callable(on_hit) else self._define_function_signature(on_hit)
         self._sig_miss = None if not callable(on_miss) else self._define_function_signature(on_miss)
 
+        # Callback invokers accepting the hit or miss count, args, and kwargs
+        self._invoke_hit = None if on_hit is None else self._create_invoker(on_hit, self._sig_hit, on_hit_every)
+        self._invoke_miss = None if on_miss is None else self._create_invoker(on_miss, self._sig_miss, on_miss_every)
+
     def __call__(self, func):
-        @wraps(func)
-        def func_wrapper(*args, **kwargs):
-            return self.run(func, *args, **kwargs)
+        make_wrapper = _WRAPPER_FACTORIES.get(type(self.algorithm))
+
+        if make_wrapper is None:
+            algorithm = self.algorithm
+            get = algorithm.get
+            create_key = algorithm.create_key
+            key_func = self.key_func
+            typed = self.include_types
+            run_miss = self._run_miss
+            invoke_hit = self._invoke_hit
+
+            def func_wrapper(*args, **kwargs):
+                if key_func is None:
+                    key = create_key(args, kwargs, typed)
+                else:
+                    key = create_key(*key_func(*args, **kwargs), typed)
+                ret = get(key, _sentinel)
+
+                if ret is _sentinel:
+                    return run_miss(func, key, args, kwargs)
+
+                if invoke_hit is not None:
+                    invoke_hit(algorithm.hits, args, kwargs)
+                return ret
+        else:
+            func_wrapper = make_wrapper(self, func)
 
+        func_wrapper = wraps(func)(func_wrapper)
         func_wrapper.cache_info = self.cache_info
         func_wrapper.cache_clear = self.cache_clear
 
@@ -152,29 +234,15 @@ class cache:
             Keyword arguments to pass to the function.
         :type func: function
         """
-        sentinel = object()
-        key_args, key_kwargs = args, kwargs
+        key = self._create_key(args, kwargs)
+        ret = self.algorithm.get(key, _sentinel)
 
-        if self.key_func:
-            key_args, key_kwargs = self.key_func(*args, **kwargs)
-
-        key = self.algorithm.create_key(key_args, key_kwargs, self.include_types)
-
-        ret = self.algorithm.get(sentinel, key)
-
-        if ret != sentinel:
-            if self.on_hit is not None:
-                self._call_with_sig(self.on_hit, self._sig_hit, (self.algorithm.hits,), *args, **kwargs)
+        if ret is not _sentinel:
+            if self._invoke_hit is not None:
+                self._invoke_hit(self.algorithm.hits, args, kwargs)
             return ret
 
-        if self.on_miss is not None:
-            self._call_with_sig(self.on_miss, self._sig_miss, (self.algorithm.misses,), *args, **kwargs)
-
-        ret = func(*args, **kwargs)
-
-        self.algorithm.put(key, ret)
-
-        return ret
+        return self._run_miss(func, key, args, kwargs)
 
     def cache_info(self):
         """Report cache statistics."""
@@ -187,26 +255,62 @@ class cache:
         """Clear the cache and cache statistics."""
         self.algorithm.clear()
 
-    def _call_with_sig(self, func, sig, internal_args, *args, **kwargs):
+    def _create_key(self, args, kwargs):
+        if self.key_func:
+            args, kwargs = self.key_func(*args, **kwargs)
+
+        return self.algorithm.create_key(args, kwargs, self.include_types)
+
+    def _run_miss(self, func, key, args, kwargs):
+        if self._invoke_miss is not None:
+            self._invoke_miss(self.algorithm.misses, args, kwargs)
+
+        ret = func(*args, **kwargs)
+
+        self.algorithm.put(key, ret)
+
+        return ret
+
+    def _validations(self):
+        if self.on_hit_every < 1:
+            raise ValueError('on_hit_every should be > 0')
+        if self.on_miss_every < 1:
+            raise ValueError('on_miss_every should be > 0')
+
+    def _create_invoker(self, func, sig, every):
+        invoke = self._create_signature_invoker(func, sig)
+
+        if every == 1:
+            return invoke
+
+        # The algorithm's lock is released by the time callbacks are invoked, so calls are counted under a separate lock
+        lock = Lock()
+        calls = [0]
+
+        def invoke_every(count, args, kwargs):
+            with lock:
+                calls[0] += 1
+                if calls[0] < every:
+                    return
+                calls[0] = 0
+
+            invoke(count, args, kwargs)
+
+        return invoke_every
+
+    def _create_signature_invoker(self, func, sig):
         if not sig:
-            return func()
+            return lambda count, args, kwargs: func()
         elif sig & (_FunctionSignature.ARGS | _FunctionSignature.KWARGS):
-            return func(*(internal_args + args), **kwargs)
+            return lambda count, args, kwargs: func(count, *args, **kwargs)
         else:
-            return func(*internal_args)
+            return lambda count, args, kwargs: func(count)
 
     def _define_function_signature(self, func):
-        sig = None
-
-        for param in signature(func).parameters.values():
-            if param.kind == Parameter.POSITIONAL_OR_KEYWORD:
-                sig = (sig or _FunctionSignature.NORMAL) | _FunctionSignature.NORMAL
-            elif param.kind == Parameter.VAR_KEYWORD:
-                sig = (sig or _FunctionSignature.KWARGS) | _FunctionSignature.KWARGS
-            elif param.kind == Parameter.VAR_POSITIONAL:
-                sig = (sig or _FunctionSignature.ARGS) | _FunctionSignature.ARGS
-
-        return sig
+        try:
+            return _cached_function_signature(func)
+        except TypeError:  # Unhashable or non weak referenceable callables can't be cached
+            return _function_signature(func)
 
 
 # Nodes
@@ -218,12 +322,16 @@ class _Node:
         self.next = None
 
 
-class _KeyNode(_Node):
-    __slots__ = ['key']
+class _MQNode(_Node):
+    __slots__ = ['key', 'value', 'frequency', 'expire_time', 'queue']
 
-    def __init__(self, key):
+    def __init__(self, key, value):
         super().__init__()
         self.key = key
+        self.value = value
+        self.frequency = 0
+        self.expire_time = None
+        self.queue = None
 
 
 class _FrequencyNode(_Node):
@@ -232,27 +340,20 @@ class _FrequencyNode(_Node):
     def __init__(self, frequency):
         super().__init__()
         self.frequency = frequency
-        self.keys = set()
+        self.keys = OrderedDict()
 
 
 class _ExpiryNode(_Node):
-    __slots__ = ['key', 'expire_time']
+    __slots__ = ['key', 'value', 'expire_time']
 
-    def __init__(self, key, expire_time):
+    def __init__(self, key, value, expire_time):
         super().__init__()
         self.key = key
+        self.value = value
         self.expire_time = expire_time
 
 
 # Data containers
-class _NodeData:
-    __slots__ = ['value', 'node']
-
-    def __init__(self, value, node):
-        self.value = value
-        self.node = node
-
-
 class _FrequencyData:
     __slots__ = ['value', 'frequency_node']
 
@@ -261,15 +362,6 @@ class _FrequencyData:
         self.frequency_node = frequency_node
 
 
-class _ExpiryData:
-    __slots__ = ['value', 'queue_node', 'access_queue_node']
-
-    def __init__(self, value, queue_node, access_queue_node):
-        self.value = value
-        self.queue_node = queue_node
-        self.access_queue_node = access_queue_node
-
-
 class _KeyValue:
     __slots__ = ['key', 'value']
 
@@ -278,16 +370,18 @@ class _KeyValue:
         self.value = value
 
 
-class _MQData:
-    __slots__ = ['value', 'frequency', 'node']
+# Data structures
+class _NullLock:
+    """Stand-in for a lock used by caches that aren't thread-safe."""
+    __slots__ = []
 
-    def __init__(self, value, frequency, node):
-        self.value = value
-        self.frequency = frequency
-        self.node = node
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
 
 
-# Data structures
 class _LinkedList:
     __slots__ = ['node_cls', 'head', 'tail', 'size']
 
@@ -301,22 +395,28 @@ class _LinkedList:
         return self.size
 
     def access(self, node):
-        if node != self.head:
-            if node == self.tail:
-                self.tail = node.prev
+        head = self.head
+        if node is not head:
+            prev_node = node.prev
+            next_node = node.next
+
+            if next_node is None:
+                self.tail = prev_node
             else:
-                node.next.prev = node.prev
+                next_node.prev = prev_node
 
-            node.prev.next = node.next
+            prev_node.next = next_node
             node.prev = None
-            node.next = self.head
-            self.head.prev = node
+            node.next = head
+            head.prev = node
             self.head = node
 
     def append(self, *args):
+        return self.append_node(self.node_cls(*args))
+
+    def append_node(self, node):
         self.size += 1
 
-        node = self.node_cls(*args)
         if self.head is None:
             self.head = node
             self.tail = node
@@ -332,12 +432,12 @@ class _LinkedList:
         self.size = 0
 
     def peek(self):
-        return None if self.tail is None else self.tail
+        return self.tail
 
     def pop(self):
         self.size -= 1
 
-        if self.head == self.tail:
+        if self.head is self.tail:
             node = self.head
             self.head = None
             self.tail = None
@@ -357,7 +457,7 @@ class _LinkedList:
     def pop_left(self):
         self.size -= 1
 
-        if self.head == self.tail:
+        if self.head is self.tail:
             node = self.tail
             self.head = None
             self.tail = None
@@ -383,10 +483,10 @@ class _LinkedList:
         if node.next is not None:
             node.next.prev = node.prev
 
-        if node == self.head:
+        if node is self.head:
             self.head = node.next
 
-        if node == self.tail:
+        if node is self.tail:
             self.tail = node.prev
 
         node.next = None
@@ -394,109 +494,135 @@ class _LinkedList:
 
 
 class _FreqList:
-    __slots__ = ['node_cls', 'head', 'tail', 'size']
+    __slots__ = ['node_cls', 'root', 'size']
 
     def __init__(self, node_cls):
         self.node_cls = node_cls
-        self.head = None
-        self.tail = None
         self.size = 0
 
+        # Sentinel node linking the head (root.next) and tail (root.prev), so the list is never empty
+        self.root = node_cls(0)
+        self.root.prev = self.root
+        self.root.next = self.root
+
     def __len__(self):
         return self.size
 
     def access(self, node, key):
-        if len(node.keys) == 1:
-            # Move to the next node if key + 1
-            if node.next is not None and node.next.frequency == node.frequency + 1:
-                node.next.prev = node.prev
+        next_node = node.next
 
-                if node.prev:
-                    node.prev.next = node.next
+        if next_node.frequency != node.frequency + 1:
+            # Increment entire node if key is the only one
+            if len(node.keys) == 1:
+                node.frequency += 1
+                return node
 
-                node.next.keys.add(key)
+            next_node = self._insert_after(node, node.frequency + 1)
 
-                if self.head == node:
-                    self.head = node.next
+        del node.keys[key]
+        next_node.keys[key] = None
 
-                return node.next
-            else:  # Otherwise increment entire node
-                node.frequency += 1
-                return node
-        else:
-            node.keys.remove(key)
-            # Move to the next node if key + 1
-            if node.next is not None and node.next.frequency == node.frequency + 1:
-                node.next.keys.add(key)
-                return node.next
-            else:  # Otherwise create a new node
-                new_node = self.node_cls(node.frequency + 1)
-                new_node.keys.add(key)
-                new_node.prev = node
-                new_node.next = node.next
-                new_node.prev.next = new_node
-
-                if new_node.next:
-                    new_node.next.prev = new_node
-
-                if self.tail == node:
-                    self.tail = new_node
-
-                return new_node
+        if not node.keys:
+            self._unlink(node)
+
+        return next_node
 
     def append(self, key):
         self.size += 1
 
-        if self.head is None:
-            node = self.node_cls(1)
-            node.keys.add(key)
-            self.head = node
-            self.tail = node
-            return node
-        elif self.head.frequency == 1:
-            self.head.keys.add(key)
-            return self.head
-        else:
-            node = self.node_cls(1)
-            node.keys.add(key)
-            node.next = self.head
-            self.head.prev = node
-            self.head = node
-            return node
+        node = self.root.next
+        if node.frequency != 1:
+            node = self._insert_after(self.root, 1)
+
+        node.keys[key] = None
+        return node
 
     def clear(self):
-        self.head = None
-        self.tail = None
+        self.root.prev = self.root
+        self.root.next = self.root
         self.size = 0
 
     def pop(self):
+        return self._pop_key(self.root.prev)
+
+    def pop_left(self):
+        return self._pop_key(self.root.next)
+
+    def _insert_after(self, prev, frequency):
+        node = self.node_cls(frequency)
+        node.prev = prev
+        node.next = prev.next
+        prev.next.prev = node
+        prev.next = node
+        return node
+
+    def _pop_key(self, node):
         self.size -= 1
-        key = self.tail.keys.pop()
+        key = node.keys.popitem(last=False)[0]
 
-        if len(self.tail.keys) == 0:
-            if self.head == self.tail:
-                self.head = None
-                self.tail = None
-            else:
-                self.tail.prev.next = None
-                self.tail = self.tail.prev
+        if not node.keys:
+            self._unlink(node)
 
         return key
 
+    def _unlink(self, node):
+        node.prev.next = node.next
+        node.next.prev = node.prev
+
+
+class _FrequencyBuckets:
+    __slots__ = ['frequencies', 'buckets', 'min_frequency']
+
+    def __init__(self):
+        self.frequencies = {}
+        self.buckets = {}
+        self.min_frequency = 0
+
+    def __len__(self):
+        return len(self.frequencies)
+
+    def access(self, key):
+        frequency = self.frequencies[key]
+        bucket = self.buckets[frequency]
+        del bucket[key]
+
+        if not bucket:
+            del self.buckets[frequency]
+
+            if self.min_frequency == frequency:
+                self.min_frequency += 1
+
+        self.frequencies[key] = frequency + 1
+        self._bucket(frequency + 1)[key] = None
+
+    def append(self, key):
+        self.frequencies[key] = 1
+        self._bucket(1)[key] = None
+        self.min_frequency = 1
+
+    def clear(self):
+        self.frequencies.clear()
+        self.buckets.clear()
+        self.min_frequency = 0
+
     def pop_left(self):
-        self.size -= 1
-        key = self.head.keys.pop()
+        bucket = self.buckets[self.min_frequency]
+        key = bucket.popitem(last=False)[0]
 
-        if len(self.head.keys) == 0:
-            if self.head == self.tail:
-                self.head = None
-                self.tail = None
-            else:
-                self.head.next.prev = None
-                self.head = self.head.next
+        if not bucket:
+            del self.buckets[self.min_frequency]
+            self.min_frequency = min(self.buckets) if self.buckets else 0
 
+        del self.frequencies[key]
         return key
 
+    def _bucket(self, frequency):
+        # Buckets keep keys in order of arrival so ties evict the oldest key, which plain dicts only do as of 3.7
+        bucket = self.buckets.get(frequency)
+        if bucket is None:
+            bucket = self.buckets[frequency] = OrderedDict()
+        return bucket
+
 
 class _HashList(list):
     """Proxy list for ensuring hash() is called no more than once.
@@ -513,9 +639,18 @@ class _HashList(list):
         return self._hash
 
 
+# Tuples cache their hash values as of Python 3.14, so keys only need the `_HashList` proxy on older versions
+_KeyType = tuple if sys.version_info >= (3, 14) else _HashList
+
+# Types which are known to cache their hash values or are cheap to hash
+_FAST_TYPES = {int, float, str, frozenset, type(None)}
+
+
 # Caching algorithms
 class BaseCache(ABC):
     """Cache interface in which other caching algorithms should implement."""
+    __slots__ = []
+
     def __init__(self):
         super().__init__()
 
@@ -604,8 +739,7 @@ class BaseCache(ABC):
         """
         return []
 
-    def create_key(self, args, kwargs, typed=False, kwarg_mark=(object(),),
-                   fast_types={int, str, frozenset, type(None)}):
+    def create_key(self, args, kwargs, typed=False, kwarg_mark=(object(),), fast_types=_FAST_TYPES):
         """Creates a cache key from optionally typed positional and keyword arguments.
 
         Borrowed from `functools`: https://docs.python.org/3/library/functools.html
@@ -619,49 +753,178 @@ class BaseCache(ABC):
         :param kwarg_mark:
             Separator object between arguments and keyword arguments.
         :param fast_types:
-            A tuple of types that are known to cache their hash values.
+            A set of types that are known to cache their hash values or are cheap to hash. Keys made up only of
+            positional arguments of these types are returned as plain tuples.
         :type args: tuple
         :type kwargs: dict
         :type typed: bool
         :type kwarg_mark: tuple
-        :type fast_types: tuple
+        :type fast_types: set
         """
-        key = args
+        if not kwargs and not typed:
+            if len(args) == 1 and type(args[0]) in fast_types:
+                return args[0]
+            if all(type(arg) in fast_types for arg in args):
+                return args
+            return _KeyType(args)
+
+        # Build the key in a single list to avoid creating intermediate tuples
+        key = list(args)
         if kwargs:
-            key += kwarg_mark
-            for item in sorted(kwargs.items()):
-                key += item
+            items = sorted(kwargs.items())
+            key.extend(kwarg_mark)
+            for item in items:
+                key.extend(item)
         if typed:
-            key += tuple(type(v) for v in args)
+            key.extend(map(type, args))
             if kwargs:
-                key += tuple(type(v) for k, v in sorted(kwargs.items()))
-        elif len(key) == 1 and type(key[0]) in fast_types:
-            return key[0]
-        return _HashList(key)
+                key.extend(type(v) for k, v in items)
+        return _KeyType(tuple(key))
+
+
+class ClockCache(BaseCache):
+    """CLOCK cache.
+
+    A CLOCK cache approximates a Least Recently Used cache without reordering keys on access. Keys are kept in a fixed
+    ring of slots, each with a reference bit which is set when the key is accessed. When the cache is full, a hand
+    sweeps the ring clearing reference bits until it finds a key that has not been accessed since the last sweep,
+    which is then evicted. A hashmap from key to slot is used for O(1) access time, and insertion is amortized O(1).
+
+    :param size:
+        The size of the cache. Once full, the first item found by the hand without its reference bit set is evicted.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
+    :type size: int
+    :type thread_safe: bool
+    """
+    __slots__ = ['_max_size', '_lock', '_hits', '_misses', '_index', '_keys', '_values', '_ref', '_hand']
+
+    def __init__(self, size, thread_safe=True):
+        super().__init__()
+        self._max_size = size
+        self._lock = Lock() if thread_safe else _NullLock()
+
+        # Cache info
+        self._hits = 0
+        self._misses = 0
+
+        # Data storage
+        self._index = {}
+        self._keys = []
+        self._values = []
+        self._ref = bytearray()
+        self._hand = 0
+
+        # Validate parameters
+        self._validations()
+
+    def _validations(self):
+        if self._max_size < 1:
+            raise ValueError('size should be > 0')
+
+    @property
+    def current_size(self):
+        return len(self._index)
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def clear(self):
+        with self._lock:
+            self._index.clear()
+            self._keys.clear()
+            self._values.clear()
+            self._ref = bytearray()
+            self._hand = 0
+
+            self._hits = 0
+            self._misses = 0
+
+    def get(self, key, sentinel):
+        with self._lock:
+            i = self._index.get(key)
+            if i is None:
+                self._misses += 1
+                return sentinel
+
+            self._hits += 1
+            self._ref[i] = 1
+            return self._values[i]
+
+    def put(self, key, value):
+        with self._lock:
+            i = self._index.get(key)
+            if i is not None:
+                self._values[i] = value
+                self._ref[i] = 1
+                return
+
+            # Fill the ring before the hand starts evicting
+            if len(self._keys) < self._max_size:
+                self._index[key] = len(self._keys)
+                self._keys.append(key)
+                self._values.append(value)
+                self._ref.append(0)
+                return
+
+            # Give every referenced key a second chance, advancing the hand until an unreferenced one is found
+            ref = self._ref
+            hand = self._hand
+            while ref[hand]:
+                ref[hand] = 0
+                hand += 1
+                if hand == self._max_size:
+                    hand = 0
+
+            del self._index[self._keys[hand]]
+            self._index[key] = hand
+            self._keys[hand] = key
+            self._values[hand] = value
+
+            hand += 1
+            self._hand = 0 if hand == self._max_size else hand
 
 
 class FIFOCache(BaseCache):
     """First-in First-out cache.
 
     A First-in First-out cache where keys are evicted in order of arrival when the cache is full. Accessing a key does
-    not change the order of eviction. This uses the `deque` class for O(1) access and insertion time.
+    not change the order of eviction. An `OrderedDict` is used to keep keys in order of arrival for O(1) access and
+    insertion time.
 
     :param size:
         The size of the cache. Once full, items are evicted in a FIFO manner.
+        Caches of 128 or more items evict `size // 64` items at a time.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type size: int
+    :type thread_safe: bool
     """
-    def __init__(self, size):
+    __slots__ = ['_max_size', '_evict_count', '_lock', '_hits', '_misses', '_map']
+
+    def __init__(self, size, thread_safe=True):
         super().__init__()
         self._max_size = size
-        self._lock = RLock()
+        self._evict_count = max(1, size // 64)
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
         self._misses = 0
 
         # Data storage
-        self._map = {}
-        self._queue = deque()
+        self._map = OrderedDict()
 
         # Validate parameters
         self._validations()
@@ -689,26 +952,27 @@ class FIFOCache(BaseCache):
     def clear(self):
         with self._lock:
             self._map.clear()
-            self._queue.clear()
 
             self._hits = 0
             self._misses = 0
 
     def get(self, key, sentinel):
         with self._lock:
-            if key in self._map:
-                self._hits += 1
-                return self._map[key]
+            try:
+                value = self._map[key]
+            except KeyError:
+                self._misses += 1
+                return sentinel
 
-            self._misses += 1
-            return sentinel
+            self._hits += 1
+            return value
 
     def put(self, key, value):
         with self._lock:
-            if key not in self._map:
-                if len(self._map) >= self._max_size:
-                    self._map.pop(self._queue.pop())
-                self._queue.appendleft(key)
+            if key not in self._map and len(self._map) >= self._max_size:
+                for _ in range(self._evict_count):
+                    self._map.popitem(last=False)
+
             self._map[key] = value
 
 
@@ -716,24 +980,30 @@ class LIFOCache(BaseCache):
     """Last-in First-out cache.
 
     A Last-in First-out cache where keys are evicted in reverse order of arrival when the cache is full. Accessing a key
-    does not change the order of eviction. This uses the `deque` class for O(1) access and insertion time.
+    does not change the order of eviction. An `OrderedDict` is used to keep keys in order of arrival for O(1) access and
+    insertion time.
 
     :param size:
-        The size of the cache. Once full, items are evicted in a FIFO manner.
+        The size of the cache. Once full, items are evicted in a LIFO manner.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type size: int
+    :type thread_safe: bool
     """
-    def __init__(self, size):
+    __slots__ = ['_max_size', '_lock', '_hits', '_misses', '_map']
+
+    def __init__(self, size, thread_safe=True):
         super().__init__()
         self._max_size = size
-        self._lock = RLock()
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
         self._misses = 0
 
         # Data storage
-        self._map = {}
-        self._queue = deque()
+        self._map = OrderedDict()
 
         # Validate parameters
         self._validations()
@@ -761,26 +1031,26 @@ class LIFOCache(BaseCache):
     def clear(self):
         with self._lock:
             self._map.clear()
-            self._queue.clear()
 
             self._hits = 0
             self._misses = 0
 
     def get(self, key, sentinel):
         with self._lock:
-            if key in self._map:
-                self._hits += 1
-                return self._map[key]
+            try:
+                value = self._map[key]
+            except KeyError:
+                self._misses += 1
+                return sentinel
 
-            self._misses += 1
-            return sentinel
+            self._hits += 1
+            return value
 
     def put(self, key, value):
         with self._lock:
-            if key not in self._map:
-                if len(self._map) >= self._max_size:
-                    self._map.pop(self._queue.popleft())
-                self._queue.appendleft(key)
+            if key not in self._map and len(self._map) >= self._max_size:
+                self._map.popitem()
+
             self._map[key] = value
 
 
@@ -788,17 +1058,25 @@ class LFUCache(BaseCache):
     """Least Frequently Used cache.
 
     A Least Frequently Used cache where keys which have been accessed the least number of times are evicted when the
-    cache is full. This uses a frequency list structure as described in "http://dhruvbird.com/lfu.pdf" for O(1) access
-    and insertion time.
+    cache is full. Keys are grouped into buckets by access frequency and the lowest non-empty frequency is tracked for
+    O(1) access and insertion time. Ties are broken by evicting the key which reached its access count first.
 
     :param size:
         The size of the cache. Once full, the least frequently accessed item is evicted.
+        Caches of 128 or more items evict `size // 64` items at a time.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type size: int
+    :type thread_safe: bool
     """
-    def __init__(self, size):
+    __slots__ = ['_max_size', '_evict_count', '_lock', '_hits', '_misses', '_map', '_frequencies']
+
+    def __init__(self, size, thread_safe=True):
         super().__init__()
         self._max_size = size
-        self._lock = RLock()
+        self._evict_count = max(1, size // 64)
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
@@ -806,7 +1084,7 @@ class LFUCache(BaseCache):
 
         # Data storage
         self._map = {}
-        self._freq_list = _FreqList(_FrequencyNode)
+        self._frequencies = _FrequencyBuckets()
 
         # Validate parameters
         self._validations()
@@ -834,58 +1112,66 @@ class LFUCache(BaseCache):
     def clear(self):
         with self._lock:
             self._map.clear()
-            self._freq_list.clear()
+            self._frequencies.clear()
 
             self._hits = 0
             self._misses = 0
 
     def get(self, key, sentinel):
         with self._lock:
-            if key in self._map:
-                self._hits += 1
-                frequency_node = self._freq_list.access(self._map[key].frequency_node, key)
-                self._map[key].frequency_node = frequency_node
-                return self._map[key].value
+            try:
+                value = self._map[key]
+            except KeyError:
+                self._misses += 1
+                return sentinel
 
-            self._misses += 1
-            return sentinel
+            self._hits += 1
+            self._frequencies.access(key)
+            return value
 
     def put(self, key, value):
         with self._lock:
             if key in self._map:
-                self._map[key].value = value
-                frequency_node = self._freq_list.access(self._map[key].frequency_node, key)
-                self._map[key].frequency_node = frequency_node
+                self._frequencies.access(key)
             else:
                 if len(self._map) >= self._max_size:
-                    self._map.pop(self._freq_list.pop_left())
+                    for _ in range(self._evict_count):
+                        self._map.pop(self._frequencies.pop_left())
 
-                frequency_node = self._freq_list.append(key)
-                self._map[key] = _FrequencyData(value, frequency_node)
+                self._frequencies.append(key)
+
+            self._map[key] = value
 
 
 class LRUCache(BaseCache):
     """Least Recently Used cache.
 
     A Least Recently Used cache where keys which have been accessed the least recently are evicted when the cache is
-    full. A linked list is used to yield O(1) access and insertion time.
+    full. An `OrderedDict` is used to keep keys in order of access for O(1) access and insertion time.
 
     :param size:
         The size of the cache. Once full, the least recently accessed item is evicted.
+        Caches of 128 or more items evict `size // 64` items at a time.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type size: int
+    :type thread_safe: bool
     """
-    def __init__(self, size):
+    __slots__ = ['_max_size', '_evict_count', '_lock', '_hits', '_misses', '_map']
+
+    def __init__(self, size, thread_safe=True):
         super().__init__()
         self._max_size = size
-        self._lock = RLock()
+        self._evict_count = max(1, size // 64)
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
         self._misses = 0
 
         # Data storage
-        self._map = {}
-        self._queue = _LinkedList(_KeyNode)
+        self._map = OrderedDict()
 
         # Validate parameters
         self._validations()
@@ -913,32 +1199,31 @@ class LRUCache(BaseCache):
     def clear(self):
         with self._lock:
             self._map.clear()
-            self._queue.clear()
 
             self._hits = 0
             self._misses = 0
 
     def get(self, key, sentinel):
         with self._lock:
-            if key in self._map:
-                self._hits += 1
-                self._queue.access(self._map[key].node)
-                return self._map[key].value
+            try:
+                value = self._map[key]
+            except KeyError:
+                self._misses += 1
+                return sentinel
 
-            self._misses += 1
-            return sentinel
+            self._hits += 1
+            self._map.move_to_end(key)
+            return value
 
     def put(self, key, value):
         with self._lock:
             if key in self._map:
-                self._map[key].value = value
-                self._queue.access(self._map[key].node)
-            else:
-                if len(self._map) >= self._max_size:
-                    self._map.pop(self._queue.pop().key)
+                self._map.move_to_end(key)
+            elif len(self._map) >= self._max_size:
+                for _ in range(self._evict_count):
+                    self._map.popitem(last=False)
 
-                node = self._queue.append(key)
-                self._map[key] = _NodeData(value, node)
+            self._map[key] = value
 
 
 class MFUCache(BaseCache):
@@ -946,16 +1231,24 @@ class MFUCache(BaseCache):
 
     A Most Frequently Used cache where keys which have been accessed the most number of times are evicted when the
     cache is full. This uses a frequency list structure as described in "http://dhruvbird.com/lfu.pdf" for O(1) access
-    and insertion time.
+    and insertion time. Ties are broken by evicting the key which reached its access count first.
 
     :param size:
         The size of the cache. Once full, the most frequently accessed item is evicted.
+        Caches of 128 or more items evict `size // 64` items at a time.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type size: int
+    :type thread_safe: bool
     """
-    def __init__(self, size):
+    __slots__ = ['_max_size', '_evict_count', '_lock', '_hits', '_misses', '_map', '_freq_list']
+
+    def __init__(self, size, thread_safe=True):
         super().__init__()
         self._max_size = size
-        self._lock = RLock()
+        self._evict_count = max(1, size // 64)
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
@@ -998,24 +1291,25 @@ class MFUCache(BaseCache):
 
     def get(self, key, sentinel):
         with self._lock:
-            if key in self._map:
+            data = self._map.get(key)
+            if data is not None:
                 self._hits += 1
-                frequency_node = self._freq_list.access(self._map[key].frequency_node, key)
-                self._map[key].frequency_node = frequency_node
-                return self._map[key].value
+                data.frequency_node = self._freq_list.access(data.frequency_node, key)
+                return data.value
 
-        self._misses += 1
-        return sentinel
+            self._misses += 1
+            return sentinel
 
     def put(self, key, value):
         with self._lock:
-            if key in self._map:
-                self._map[key].value = value
-                frequency_node = self._freq_list.access(self._map[key].frequency_node, key)
-                self._map[key].frequency_node = frequency_node
+            data = self._map.get(key)
+            if data is not None:
+                data.value = value
+                data.frequency_node = self._freq_list.access(data.frequency_node, key)
             else:
                 if len(self._map) >= self._max_size:
-                    self._map.pop(self._freq_list.pop())
+                    for _ in range(self._evict_count):
+                        self._map.pop(self._freq_list.pop())
 
                 frequency_node = self._freq_list.append(key)
                 self._map[key] = _FrequencyData(value, frequency_node)
@@ -1053,25 +1347,36 @@ class MQCache(BaseCache):
         A function that determines which queue to insert a node based on it's frequency. Defaults to `log(freq, 2)`.
     :param access_based:
         Whether the "time" should be based on accesses (i.e. each access increments time by 1) or by actual time.
-        Defaults to False.
+        Defaults to True.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type size: int
     :type buffer_size: int
     :type expire_time: int
     :type num_queues: int
     :type queue_func: function
     :type access_based: bool
+    :type thread_safe: bool
     """
+    __slots__ = ['_max_size', '_buffer_size', '_expire_time', '_num_queues', '_queue_func', '_queue_table',
+                 '_access_based', '_current_time', '_next_adjust', '_lock', '_hits', '_misses', '_map', '_buffer_map',
+                 '_queues', '_buffer_queue']
+    _QUEUE_TABLE_LIMIT = 1024
+
     def __init__(self, size, buffer_size, expire_time, num_queues=8, queue_func=lambda f: math.log(f, 2),
-                 access_based=True):
+                 access_based=True, thread_safe=True):
         super().__init__()
         self._max_size = size
         self._buffer_size = buffer_size
         self._expire_time = expire_time
         self._num_queues = num_queues
         self._queue_func = queue_func
+        self._queue_table = [0]
         self._access_based = access_based
         self._current_time = 0
-        self._lock = RLock()
+        self._next_adjust = float('inf')
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
@@ -1080,8 +1385,8 @@ class MQCache(BaseCache):
         # Data storage
         self._map = {}
         self._buffer_map = {}
-        self._queues = [_LinkedList(_ExpiryNode) for _ in range(num_queues)]
-        self._buffer_queue = _LinkedList(_ExpiryNode)
+        self._queues = [_LinkedList(_MQNode) for _ in range(num_queues)]
+        self._buffer_queue = _LinkedList(_MQNode)
 
         # Validate parameters
         self._validations()
@@ -1120,94 +1425,114 @@ class MQCache(BaseCache):
             self._map.clear()
             self._buffer_map.clear()
             self._buffer_queue.clear()
-            list(map(lambda x: x.clear(), self._queues))
+            for queue in self._queues:
+                queue.clear()
+            self._next_adjust = float('inf')
 
             self._hits = 0
             self._misses = 0
 
     def get(self, key, sentinel):
         with self._lock:
-            self._current_time = self._current_time + 1 if self._access_based else time()
+            if self._access_based:
+                self._current_time += 1
+            else:
+                self._current_time = monotonic()
 
-            if key in self._map:
-                self._hits += 1
+            now = self._current_time
+            expire_time = now + self._expire_time
 
-                # Remove item from current queue
-                item = self._map[key]
-                queue = self._get_queue(item.frequency)
-                self._queues[queue].remove(item.node)
-            elif key in self._buffer_map:
+            node = self._map.get(key)
+            if node is not None:
                 self._hits += 1
 
+                # Remove item from current queue
+                self._queues[node.queue].remove(node)
+            else:
                 # Remove item from buffer
-                item = self._buffer_map.pop(key)
-                self._buffer_queue.remove(item.node)
+                node = self._buffer_map.pop(key, None)
+                if node is None:
+                    self._misses += 1
+                    return sentinel
+
+                self._hits += 1
+                self._buffer_queue.remove(node)
 
                 # If key in buffer map, then map has to be full
-                self._evict_block()
-            else:
-                self._misses += 1
-                return sentinel
+                self._evict_block(expire_time)
 
             # Add item to queue
-            item.frequency += 1
-            expire_time = self._current_time + self._expire_time
-            queue = self._get_queue(item.frequency)
-            item.node = self._queues[queue].append(key, expire_time)
+            node.frequency += 1
+            self._enqueue(node, self._get_queue(node.frequency), expire_time)
 
             # Add item to map
-            self._map[key] = item
+            self._map[key] = node
 
             # Demote items to below queues if not accessed within life time
-            self._adjust()
+            if now > self._next_adjust:
+                self._adjust(now, expire_time)
 
-            return item.value
+            return node.value
 
     def put(self, key, value):
         with self._lock:
-            self._current_time = self._current_time if self._access_based else time()
+            if not self._access_based:
+                self._current_time = monotonic()
 
-            if key in self._map:
-                item = self._map[key]
-                item.value = value
+            now = self._current_time
+            expire_time = now + self._expire_time
 
+            node = self._map.get(key)
+            if node is not None:
                 # Remove item from current queue
-                queue = self._get_queue(item.frequency)
-                self._queues[queue].remove(item.node)
-            elif key in self._buffer_map:
-                # Remove item from buffer
-                item = self._buffer_map.pop(key)
-                self._buffer_queue.remove(item.node)
-                item.value = value
+                self._queues[node.queue].remove(node)
             else:
-                item = _MQData(value, 0, None)
+                # Remove item from buffer
+                node = self._buffer_map.pop(key, None)
+                if node is None:
+                    node = _MQNode(key, value)
+                else:
+                    self._buffer_queue.remove(node)
+
+            node.value = value
 
             # Make room if cache is full
             if len(self._map) >= self._max_size:
-                self._evict_block()
+                self._evict_block(expire_time)
 
             # Add item to queue
-            item.frequency += 1
-            expire_time = self._current_time + self._expire_time
-            queue = self._get_queue(item.frequency)
-            item.node = self._queues[queue].append(key, expire_time)
+            node.frequency += 1
+            self._enqueue(node, self._get_queue(node.frequency), expire_time)
 
             # Add item to map
-            self._map[key] = item
+            self._map[key] = node
 
             # Demote items to below queues if not accessed within life time
-            self._adjust()
+            if now > self._next_adjust:
+                self._adjust(now, expire_time)
 
-    def _adjust(self):
+    def _adjust(self, now, expire_time):
+        # Queues are ordered by expire time, so nothing needs demoting until the earliest head expires
+        self._next_adjust = float('inf')
         for k in range(1, self._num_queues):
             node = self._queues[k].peek()
-            while node and node.expire_time < self._current_time:
-                key = self._queues[k].pop().key
-                expire_time = self._current_time + self._expire_time
-                self._queues[k - 1].append(key, expire_time)
+            while node and node.expire_time < now:
+                self._queues[k].pop()
+                self._enqueue(node, k - 1, expire_time)
                 node = self._queues[k].peek()
 
-    def _evict_block(self):
+            if node and node.expire_time < self._next_adjust:
+                self._next_adjust = node.expire_time
+
+    def _enqueue(self, node, queue, expire_time):
+        node.expire_time = expire_time
+        node.queue = queue
+        self._queues[queue].append_node(node)
+
+        if queue and expire_time < self._next_adjust:
+            self._next_adjust = expire_time
+
+    def _evict_block(self, expire_time):
         non_empty_queue = self._find_non_empty_queue()
         if non_empty_queue > -1:
             # Reduce buffer if full
@@ -1215,47 +1540,64 @@ class MQCache(BaseCache):
                 self._buffer_map.pop(self._buffer_queue.pop().key)
 
             # Remove victim from queue map
-            key = self._queues[non_empty_queue].pop().key
-            item = self._map.pop(key)
+            node = self._queues[non_empty_queue].pop()
+            del self._map[node.key]
 
             # Add victim to history buffer
-            expire_time = self._current_time + self._expire_time
-            item.node = self._buffer_queue.append(key, expire_time)
-            self._buffer_map[key] = item
+            node.expire_time = expire_time
+            node.queue = None
+            self._buffer_map[node.key] = self._buffer_queue.append_node(node)
 
     def _find_non_empty_queue(self):
-        for k in range(self._num_queues):
-            if len(self._queues[k]) > 0:
+        for k, queue in enumerate(self._queues):
+            if queue.size:
                 return k
         return -1
 
     def _get_queue(self, frequency):
-        return min(int(self._queue_func(frequency)), self._num_queues - 1)
+        queue_table = self._queue_table
+        if frequency < len(queue_table):
+            return queue_table[frequency]
+
+        # Frequencies beyond the table limit are rare, so compute them directly rather than growing without bound
+        if frequency >= self._QUEUE_TABLE_LIMIT:
+            return min(int(self._queue_func(frequency)), self._num_queues - 1)
+
+        # Double the table of precomputed queues, index 0 is unused since frequencies start at 1
+        size = min(len(queue_table) * 2, self._QUEUE_TABLE_LIMIT)
+        for f in range(len(queue_table), size):
+            queue_table.append(min(int(self._queue_func(f)), self._num_queues - 1))
+
+        return queue_table[frequency]
 
 
 class MRUCache(BaseCache):
     """Most Recently Used cache.
 
     A Most Recently Used cache where keys which have been accessed the most recently are evicted when the cache is
-    full. A linked list is used which evicts from the head, appends at the head, and moves accesses to the head, yields
-    for O(1) access and insertion time.
+    full. An `OrderedDict` is used to keep keys in order of access for O(1) access and insertion time.
 
     :param size:
         The size of the cache. Once full, the most recently accessed item is evicted.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type size: int
+    :type thread_safe: bool
     """
-    def __init__(self, size):
+    __slots__ = ['_max_size', '_lock', '_hits', '_misses', '_map']
+
+    def __init__(self, size, thread_safe=True):
         super().__init__()
         self._max_size = size
-        self._lock = RLock()
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
         self._misses = 0
 
         # Data storage
-        self._map = {}
-        self._queue = _LinkedList(_KeyNode)
+        self._map = OrderedDict()
 
         # Validate parameters
         self._validations()
@@ -1283,17 +1625,17 @@ class MRUCache(BaseCache):
     def clear(self):
         with self._lock:
             self._map.clear()
-            self._queue.clear()
 
             self._hits = 0
             self._misses = 0
 
     def get(self, key, sentinel):
         with self._lock:
-            if key in self._map:
+            value = self._map.get(key, _sentinel)
+            if value is not _sentinel:
                 self._hits += 1
-                self._queue.access(self._map[key].node)
-                return self._map[key].value
+                self._map.move_to_end(key)
+                return value
 
             self._misses += 1
             return sentinel
@@ -1301,31 +1643,35 @@ class MRUCache(BaseCache):
     def put(self, key, value):
         with self._lock:
             if key in self._map:
-                self._map[key].value = value
-                self._queue.access(self._map[key].node)
-            else:
-                if len(self._map) >= self._max_size:
-                    self._map.pop(self._queue.pop_left().key)
+                self._map.move_to_end(key)
+            elif len(self._map) >= self._max_size:
+                self._map.popitem()
 
-                node = self._queue.append(key)
-                self._map[key] = _NodeData(value, node)
+            self._map[key] = value
 
 
 class NMRUCache(BaseCache):
     """Not Most Recently Used cache.
 
     A Not Most Recently Used cache where keys which have not been accessed the most recently are evicted when the cache
-    is full. When the cache is full, a random key other than the most recently inserted is removed. A hash map is used
-    to keep track of cached items for O(1) access and insertion time.
+    is full. When the cache is full, a random key other than the most recently used is removed. A hash map is used to
+    keep track of cached items, along with a list of keys to pick the evicted key from, for O(1) access and insertion
+    time.
 
     :param size:
         The size of the cache. Once full, one of the not most recently accessed item is evicted.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type size: int
+    :type thread_safe: bool
     """
-    def __init__(self, size):
+    __slots__ = ['_max_size', '_lock', '_hits', '_misses', '_store', '_keys', '_mru_item']
+
+    def __init__(self, size, thread_safe=True):
         super().__init__()
         self._max_size = size
-        self._lock = RLock()
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
@@ -1333,6 +1679,7 @@ class NMRUCache(BaseCache):
 
         # Data storage
         self._store = {}
+        self._keys = []
         self._mru_item = None
 
         # Validate parameters
@@ -1362,6 +1709,7 @@ class NMRUCache(BaseCache):
     def clear(self):
         with self._lock:
             self._store.clear()
+            self._keys.clear()
             self._mru_item = None
 
             self._hits = 0
@@ -1373,11 +1721,11 @@ class NMRUCache(BaseCache):
                 self._hits += 1
                 return self._mru_item.value
 
-            if key in self._store:
+            value = self._store.pop(key, _sentinel)
+            if value is not _sentinel:
                 self._hits += 1
-                self._store[self._mru_item.key] = self._mru_item.value
-                self._mru_item = _KeyValue(key, self._store.pop(key))
-                return self._mru_item.value
+                self._swap_mru_item(key, value)
+                return value
 
             self._misses += 1
             return sentinel
@@ -1386,35 +1734,60 @@ class NMRUCache(BaseCache):
         with self._lock:
             if self._mru_item and key == self._mru_item.key:
                 self._mru_item.value = value
-            elif key in self._store:
-                self._store[self._mru_item.key] = self._mru_item.value
-                self._mru_item = _KeyValue(key, self._store.pop(key))
-            else:
-                # Current size should include mru item
-                if len(self._store) + 1 >= self._max_size > 1:
-                        self._store.popitem()
+            elif self._store.pop(key, _sentinel) is not _sentinel:
+                self._swap_mru_item(key, value)
+            elif self._mru_item is None:
+                self._keys.append(key)
+                self._mru_item = _KeyValue(key, value)
+            elif self._max_size > 1:
+                keys = self._keys
 
-                # Move mru item to store if exists
-                if self._mru_item and self._max_size > 1:
-                    self._store[self._mru_item.key] = self._mru_item.value
+                # Current size should include mru item
+                if len(keys) >= self._max_size:
+                    # Evict a random key other than the mru item, which is swapped for the last key if picked
+                    i = random.randrange(len(keys) - 1)
+                    if keys[i] == self._mru_item.key:
+                        i = len(keys) - 1
+
+                    del self._store[keys[i]]
+                    keys[i] = key
+                else:
+                    keys.append(key)
+
+                self._swap_mru_item(key, value)
+            else:
+                self._keys[0] = key
+                self._mru_item.key = key
+                self._mru_item.value = value
 
-                self._mru_item = _KeyValue(key, value)
+    def _swap_mru_item(self, key, value):
+        # Move mru item to store and reuse it for the new key
+        mru_item = self._mru_item
+        self._store[mru_item.key] = mru_item.value
+        mru_item.key = key
+        mru_item.value = value
 
 
 class RRCache(BaseCache):
     """Random replacement cache.
 
     A Random replacement cache where keys are evicted randomly, regardless of access or insertion order. This uses a
-    simple hashmap for O(1) access and insertion time.
+    simple hashmap, along with a list of keys to pick the evicted key from, for O(1) access and insertion time.
 
     :param size:
         The size of the cache. Once full, items are evicted randomly.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type size: int
+    :type thread_safe: bool
     """
-    def __init__(self, size):
+    __slots__ = ['_max_size', '_lock', '_hits', '_misses', '_store', '_keys']
+
+    def __init__(self, size, thread_safe=True):
         super().__init__()
         self._max_size = size
-        self._lock = RLock()
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
@@ -1422,6 +1795,7 @@ class RRCache(BaseCache):
 
         # Data storage
         self._store = {}
+        self._keys = []
 
         # Validate parameters
         self._validations()
@@ -1449,28 +1823,33 @@ class RRCache(BaseCache):
     def clear(self):
         with self._lock:
             self._store.clear()
+            self._keys.clear()
 
             self._hits = 0
             self._misses = 0
 
     def get(self, key, sentinel):
         with self._lock:
-            if key in self._store:
+            value = self._store.get(key, _sentinel)
+            if value is not _sentinel:
                 self._hits += 1
-                return self._store[key]
+                return value
 
             self._misses += 1
             return sentinel
 
     def put(self, key, value):
         with self._lock:
-            if key in self._store:
-                self._store[key] = value
-            else:
-                if len(self._store) >= self._max_size:
-                    self._store.popitem()
+            if key not in self._store:
+                # Evict a random key and take over its slot in the key list
+                if len(self._keys) >= self._max_size:
+                    i = random.randrange(len(self._keys))
+                    del self._store[self._keys[i]]
+                    self._keys[i] = key
+                else:
+                    self._keys.append(key)
 
-                self._store[key] = value
+            self._store[key] = value
 
 
 class SLRUCache(BaseCache):
@@ -1490,24 +1869,29 @@ class SLRUCache(BaseCache):
         The size of the protected cache. Once full, the least recently accessed item is moved to the probationary queue.
     :param probationary_size:
         The size of the probationary cache. Once full, items are evicted in a FIFO manner.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type protected_size: int
     :type probationary_size: int
+    :type thread_safe: bool
     """
-    def __init__(self, protected_size, probationary_size):
+    __slots__ = ['_protected_size', '_probationary_size', '_lock', '_hits', '_misses', '_probationary_map',
+                 '_protected_map']
+
+    def __init__(self, protected_size, probationary_size, thread_safe=True):
         super().__init__()
         self._protected_size = protected_size
         self._probationary_size = probationary_size
-        self._lock = RLock()
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
         self._misses = 0
 
         # Data storage
-        self._probationary_map = {}
-        self._protected_map = {}
-        self._probationary_store = _LinkedList(_KeyNode)
-        self._protected_store = _LinkedList(_KeyNode)
+        self._probationary_map = OrderedDict()
+        self._protected_map = OrderedDict()
 
         # Validate parameters
         self._validations()
@@ -1539,8 +1923,6 @@ class SLRUCache(BaseCache):
         with self._lock:
             self._probationary_map.clear()
             self._protected_map.clear()
-            self._probationary_store.clear()
-            self._protected_store.clear()
 
             self._hits = 0
             self._misses = 0
@@ -1548,30 +1930,17 @@ class SLRUCache(BaseCache):
     def get(self, key, sentinel):
         with self._lock:
             # Protected is 'hot' cache, i.e. more likely to be found here
-            if key in self._protected_map:
+            value = self._protected_map.get(key, _sentinel)
+            if value is not _sentinel:
                 self._hits += 1
-                self._protected_store.access(self._protected_map[key].node)
-                return self._protected_map[key].value
+                self._protected_map.move_to_end(key)
+                return value
 
             # Probationary cache hits move to protected
-            if key in self._probationary_map:
+            value = self._probationary_map.pop(key, _sentinel)
+            if value is not _sentinel:
                 self._hits += 1
-                o = self._probationary_map.pop(key)
-                self._probationary_store.remove(o.node)
-                value = o.value
-
-                # If protected is full, move LRU to probationary
-                if len(self._protected_map) >= self._protected_size:
-                    other_key = self._protected_store.pop().key
-                    other_value = self._protected_map.pop(other_key).value
-
-                    # Probationary won't be full because we just evicted from it
-
-                    other_node = self._probationary_store.append(other_key)
-                    self._probationary_map[other_key] = _NodeData(other_value, other_node)
-
-                node = self._protected_store.append(key)
-                self._protected_map[key] = _NodeData(value, node)
+                self._protect(key, value)
                 return value
 
             self._misses += 1
@@ -1580,35 +1949,30 @@ class SLRUCache(BaseCache):
     def put(self, key, value):
         with self._lock:
             if key in self._protected_map:
-                self._protected_map[key].value = value
-                self._protected_store.access(self._protected_map[key].node)
+                self._protected_map[key] = value
+                self._protected_map.move_to_end(key)
 
             # Probationary cache hits move to protected
-            elif key in self._probationary_map:
-                node = self._probationary_map.pop(key).node
-                self._probationary_store.remove(node)
-
-                # If protected is full, move LRU to probationary
-                if len(self._protected_map) >= self._protected_size:
-                    other_key = self._protected_store.pop().key
-                    other_value = self._protected_map.pop(other_key).value
-
-                    # Probationary won't be full because we just evicted from it
-
-                    other_node = self._probationary_store.append(other_key)
-                    self._probationary_map[other_key] = _NodeData(other_value, other_node)
-
-                node = self._protected_store.append(key)
-                self._protected_map[key] = _NodeData(value, node)
+            elif self._probationary_map.pop(key, _sentinel) is not _sentinel:
+                self._protect(key, value)
 
             # Place in probationary
             else:
                 # If probationary is full, evict LRU
                 if len(self._probationary_map) >= self._probationary_size:
-                    self._probationary_map.pop(self._probationary_store.pop().key)
+                    self._probationary_map.popitem(last=False)
 
-                node = self._probationary_store.append(key)
-                self._probationary_map[key] = _NodeData(value, node)
+                self._probationary_map[key] = value
+
+    def _protect(self, key, value):
+        # If protected is full, move LRU to probationary
+        if len(self._protected_map) >= self._protected_size:
+            other_key, other_value = self._protected_map.popitem(last=False)
+
+            # Probationary won't be full because we just evicted from it
+            self._probationary_map[other_key] = other_value
+
+        self._protected_map[key] = value
 
 
 class StaticCache(BaseCache):
@@ -1616,13 +1980,20 @@ class StaticCache(BaseCache):
 
     A simple cache with no key eviction. The implementation is a simple key/value store with O(1) access and insertion
     time. Keys are stored permanently, or at least until the cache is cleared.
+
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
+    :type thread_safe: bool
     """
-    def __init__(self):
+    __slots__ = ['_hits', '_misses', '_lock', '_store']
+
+    def __init__(self, thread_safe=True):
         super().__init__()
         # Cache info
         self._hits = 0
         self._misses = 0
-        self._lock = RLock()
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Data storage
         self._store = {}
@@ -1651,12 +2022,13 @@ class StaticCache(BaseCache):
 
     def get(self, key, sentinel):
         with self._lock:
-            if key in self._store:
+            value = self._store.get(key, _sentinel)
+            if value is not _sentinel:
                 self._hits += 1
-                return self._store[key]
+                return value
 
-        self._misses += 1
-        return sentinel
+            self._misses += 1
+            return sentinel
 
     def put(self, key, value):
         with self._lock:
@@ -1672,8 +2044,9 @@ class TLRUCache(BaseCache):
     If `reset_on_access` is True, the `expire_time` is reset each time the item is accessed; otherwise it is expired
     from the time of initial insertion in the cache.
 
-    This is implemented with two LRU lists, one for LRU-based expiration and another for time-based expiration. This
-    implementation provides a O(1) time complexity for both accesses and insertions.
+    This is implemented with a linked list for time-based expiration, and an ordered map for LRU-based expiration when
+    `reset_on_access` is False (otherwise the list is already in LRU order). This implementation provides a O(1) time
+    complexity for both accesses and insertions.
 
     :param expire_time:
         The minimum number of accesses required to stay in cache if `access_based` is True, otherwise the time in
@@ -1687,27 +2060,33 @@ class TLRUCache(BaseCache):
     :param reset_on_access:
         Whether to reset the key's expire time when accessed. Otherwise the key is expired after the `expire time`
         regardless of whether it is accessed or not. Defaults to True.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type expire_time: int
     :type size: int, None
     :type access_based: bool
     :type reset_on_access: bool
+    :type thread_safe: bool
     """
-    def __init__(self, expire_time, size=None, access_based=False, reset_on_access=True):
+    __slots__ = ['_expire_time', '_max_size', '_reset_on_access', '_access_based', '_current_time', '_lock', '_hits',
+                 '_misses', '_map', '_access_queue']
+
+    def __init__(self, expire_time, size=None, access_based=False, reset_on_access=True, thread_safe=True):
         super().__init__()
         self._expire_time = expire_time
         self._max_size = size
         self._reset_on_access = reset_on_access
         self._access_based = access_based
         self._current_time = 0
-        self._lock = RLock()
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
         self._misses = 0
 
         # Data storage
-        self._map = {}
-        self._queue = _LinkedList(_KeyNode) if size else None
+        self._map = {} if reset_on_access else OrderedDict()
         self._access_queue = _LinkedList(_ExpiryNode)
 
         # Validate parameters
@@ -1743,85 +2122,88 @@ class TLRUCache(BaseCache):
             self._map.clear()
             self._access_queue.clear()
 
-            if self._queue is not None:
-                self._queue.clear()
-
             self._hits = 0
             self._misses = 0
             self._current_time = 0
 
     def get(self, key, sentinel):
         with self._lock:
-            self._current_time = self._current_time + 1 if self._access_based else time()
+            now = self._current_time = self._current_time + 1 if self._access_based else monotonic()
+            cache_map = self._map
+            access_queue = self._access_queue
 
             # Remove nodes not accessed within expire time
-            self._adjust()
+            oldest = access_queue.tail
+            if oldest is not None and oldest.expire_time < now:
+                self._adjust(now)
 
-            if key in self._map:
+            node = cache_map.get(key)
+            if node is not None:
                 self._hits += 1
 
-                # If no size, no point in using LRU queue, otherwise move to front of LRU queue
-                if self._queue is not None:
-                    self._queue.access(self._map[key].queue_node)
-
-                # Move to front of access queue and reset access if enabled
+                # Move to front of access queue and reset access if enabled, which also keeps it in LRU order
                 if self._reset_on_access:
-                    self._map[key].access_queue_node.expire_time = self._current_time + self._expire_time
-                    self._access_queue.access(self._map[key].access_queue_node)
+                    node.expire_time = now + self._expire_time
+                    access_queue.access(node)
 
-                return self._map[key].value
+                # If no size, no point in keeping LRU order, otherwise move to end of LRU order
+                elif self._max_size:
+                    cache_map.move_to_end(key)
 
-            # Remove nodes not accessed within expire time
-            self._adjust()
+                return node.value
 
             self._misses += 1
             return sentinel
 
     def put(self, key, value):
         with self._lock:
-            self._current_time = self._current_time if self._access_based else time()
+            if not self._access_based:
+                self._current_time = monotonic()
 
-            # Remove nodes not accessed within expire time
-            self._adjust()
+            now = self._current_time
+            expire_time = now + self._expire_time
+            cache_map = self._map
+            access_queue = self._access_queue
 
-            if key in self._map:
-                self._map[key].value = value
+            # Remove nodes not accessed within expire time
+            oldest = access_queue.tail
+            if oldest is not None and oldest.expire_time < now:
+                self._adjust(now)
 
-                # If no size, no point in using LRU queue, otherwise move to front of LRU queue
-                if self._queue is not None:
-                    self._queue.access(self._map[key].queue_node)
+            node = cache_map.get(key)
+            if node is not None:
+                node.value = value
 
-                # Move to front of access queue and reset access if enabled
+                # Move to front of access queue and reset access if enabled, which also keeps it in LRU order
                 if self._reset_on_access:
-                    self._map[key].access_queue_node.expire_time = self._current_time + self._expire_time
-                    self._access_queue.access(self._map[key].access_queue_node)
-            else:
-                # Remove from LRU queue is over capacity
-                if self._max_size and len(self._map) >= self._max_size:
-                    other_key = self._queue.pop().key
-                    access_queue_node = self._map.pop(other_key).access_queue_node
-                    self._access_queue.remove(access_queue_node)
-
-                # Append to LRU queue if bounded by size
-                queue_node = None
-                if self._queue is not None:
-                    queue_node = self._queue.append(key)
+                    node.expire_time = expire_time
+                    access_queue.access(node)
 
-                expire_time = self._current_time + self._expire_time
-                access_queue_node = self._access_queue.append(key, expire_time)
+                # If no size, no point in keeping LRU order, otherwise move to end of LRU order
+                elif self._max_size:
+                    cache_map.move_to_end(key)
 
-                self._map[key] = _ExpiryData(value, queue_node, access_queue_node)
+            # Evict LRU if over capacity, reusing the evicted node for the new key
+            elif self._max_size and len(cache_map) >= self._max_size:
+                if self._reset_on_access:
+                    node = access_queue.pop()
+                    del cache_map[node.key]
+                else:
+                    node = cache_map.popitem(last=False)[1]
+                    access_queue.remove(node)
+
+                node.key = key
+                node.value = value
+                node.expire_time = expire_time
+                cache_map[key] = access_queue.append_node(node)
+            else:
+                cache_map[key] = access_queue.append(key, value, expire_time)
 
-    def _adjust(self):
+    def _adjust(self, now):
         # Remove items that haven't been accessed within expiration time
         node = self._access_queue.peek()
-        while node and node.expire_time < self._current_time:
-            key = self._access_queue.pop().key
-            queue_node = self._map.pop(key).queue_node
-
-            if self._queue is not None:
-                self._queue.remove(queue_node)
-
+        while node and node.expire_time < now:
+            del self._map[self._access_queue.pop().key]
             node = self._access_queue.peek()
 
 
@@ -1841,24 +2223,28 @@ class TwoQCache(BaseCache):
         The size of the primary queue for the cache. Once full, the least recently accessed item is evicted.
     :param secondary_size:
         The size of the secondary queue for the cache. One full, items are evicted in a FIFO manner.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type primary_size: int
     :type secondary_size: int
+    :type thread_safe: bool
     """
-    def __init__(self, primary_size, secondary_size):
+    __slots__ = ['_primary_size', '_secondary_size', '_lock', '_hits', '_misses', '_primary_map', '_secondary_map']
+
+    def __init__(self, primary_size, secondary_size, thread_safe=True):
         super().__init__()
         self._primary_size = primary_size
         self._secondary_size = secondary_size
-        self._lock = RLock()
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
         self._misses = 0
 
         # Data storage
-        self._primary_map = {}
-        self._secondary_map = {}
-        self._primary_store = _LinkedList(_KeyNode)
-        self._secondary_store = _LinkedList(_KeyNode)
+        self._primary_map = OrderedDict()
+        self._secondary_map = OrderedDict()
 
         # Validate parameters
         self._validations()
@@ -1890,52 +2276,53 @@ class TwoQCache(BaseCache):
         with self._lock:
             self._primary_map.clear()
             self._secondary_map.clear()
-            self._primary_store.clear()
-            self._secondary_store.clear()
 
             self._hits = 0
             self._misses = 0
 
     def get(self, key, sentinel):
         with self._lock:
+            primary_map = self._primary_map
+
             # Primary is 'hot' cache, i.e. more likely to be found here
-            if key in self._primary_map:
+            value = primary_map.get(key, _sentinel)
+            if value is not _sentinel:
                 self._hits += 1
-                self._primary_store.access(self._primary_map[key].node)
-                return self._primary_map[key].value
+                primary_map.move_to_end(key)
+                return value
 
             # Secondary cache hits move to primary
-            if key in self._secondary_map:
+            value = self._secondary_map.pop(key, _sentinel)
+            if value is not _sentinel:
                 self._hits += 1
-                o = self._secondary_map.pop(key)
-                self._secondary_store.remove(o.node)
 
                 # Make room for key in primary queue
-                if len(self._primary_map) >= self._primary_size:
-                    self._primary_map.pop(self._primary_store.pop().key)
+                if len(primary_map) >= self._primary_size:
+                    primary_map.popitem(last=False)
 
-                node = self._primary_store.append(key)
-                self._primary_map[key] = _NodeData(o.value, node)
-                return o.value
+                primary_map[key] = value
+                return value
 
             self._misses += 1
             return sentinel
 
     def put(self, key, value):
         with self._lock:
-            if key in self._primary_map:
-                self._primary_map[key].value = value
-                self._primary_store.access(self._primary_map[key].node)
-            elif key in self._secondary_map:
-                self._secondary_map[key].value = value
-                self._secondary_store.access(self._secondary_map[key].node)
+            primary_map = self._primary_map
+            secondary_map = self._secondary_map
+
+            if key in primary_map:
+                primary_map[key] = value
+                primary_map.move_to_end(key)
+            elif key in secondary_map:
+                secondary_map[key] = value
+                secondary_map.move_to_end(key)
             else:
                 # Make room for key in secondary queue
-                if len(self._secondary_map) >= self._secondary_size:
-                    self._secondary_map.pop(self._secondary_store.pop().key)
+                if len(secondary_map) >= self._secondary_size:
+                    secondary_map.popitem(last=False)
 
-                node = self._secondary_store.append(key)
-                self._secondary_map[key] = _NodeData(value, node)
+                secondary_map[key] = value
 
 
 class TwoQFullCache(BaseCache):
@@ -1962,28 +2349,32 @@ class TwoQFullCache(BaseCache):
         FIFO manner.
     :param secondary_out_size:
         The size of the secondary "out" queue for the cache. Once full, items are evicted in a FIFO manner.
+    :param thread_safe:
+        Whether to guard the cache with a lock. Only disable this if the cache is never accessed from more than one
+        thread at a time. Defaults to True.
     :type primary_size: int
     :type secondary_in_size: int
     :type secondary_out_size: int
+    :type thread_safe: bool
     """
-    def __init__(self, primary_size, secondary_in_size, secondary_out_size):
+    __slots__ = ['_primary_size', '_secondary_in_size', '_secondary_out_size', '_lock', '_hits', '_misses',
+                 '_primary_map', '_secondary_in_map', '_secondary_out_map']
+
+    def __init__(self, primary_size, secondary_in_size, secondary_out_size, thread_safe=True):
         super().__init__()
         self._primary_size = primary_size
         self._secondary_in_size = secondary_in_size
         self._secondary_out_size = secondary_out_size
-        self._lock = RLock()
+        self._lock = Lock() if thread_safe else _NullLock()
 
         # Cache info
         self._hits = 0
         self._misses = 0
 
         # Data storage
-        self._primary_map = {}
-        self._secondary_in_map = {}
-        self._secondary_out_map = {}
-        self._primary_store = _LinkedList(_KeyNode)
-        self._secondary_in_store = _LinkedList(_KeyNode)
-        self._secondary_out_store = _LinkedList(_KeyNode)
+        self._primary_map = OrderedDict()
+        self._secondary_in_map = OrderedDict()
+        self._secondary_out_map = OrderedDict()
 
         # Validate parameters
         self._validations()
@@ -2019,73 +2410,342 @@ class TwoQFullCache(BaseCache):
             self._primary_map.clear()
             self._secondary_in_map.clear()
             self._secondary_out_map.clear()
-            self._primary_store.clear()
-            self._secondary_in_store.clear()
-            self._secondary_out_store.clear()
 
             self._hits = 0
             self._misses = 0
 
     def get(self, key, sentinel):
         with self._lock:
+            primary_map = self._primary_map
+
             # Primary is 'hot' cache, i.e. more likely to be found here
-            if key in self._primary_map:
+            value = primary_map.get(key, _sentinel)
+            if value is not _sentinel:
                 self._hits += 1
-                self._primary_store.access(self._primary_map[key].node)
-                return self._primary_map[key].value
+                primary_map.move_to_end(key)
+                return value
 
             # Secondary 'in' cache hits do nothing
-            if key in self._secondary_in_map:
+            value = self._secondary_in_map.get(key, _sentinel)
+            if value is not _sentinel:
                 self._hits += 1
-                return self._secondary_in_map[key].value
+                return value
 
             # Secondary 'out' cache hits move to primary
-            if key in self._secondary_out_map:
+            value = self._secondary_out_map.pop(key, _sentinel)
+            if value is not _sentinel:
                 self._hits += 1
-                o = self._secondary_out_map.pop(key)
-                self._secondary_out_store.remove(o.node)
-
-                # Make room for key in primary queue
-                if len(self._primary_map) >= self._primary_size:
-                    self._primary_map.pop(self._primary_store.pop().key)
-
-                node = self._primary_store.append(key)
-                self._primary_map[key] = _NodeData(o.value, node)
-                return o.value
+                self._promote(key, value)
+                return value
 
             self._misses += 1
             return sentinel
 
     def put(self, key, value):
         with self._lock:
-            if key in self._primary_map:
-                self._primary_map[key].value = value
-                self._primary_store.access(self._primary_map[key].node)
-            elif key in self._secondary_in_map:
-                self._secondary_in_map[key].value = value
-                self._secondary_in_store.access(self._secondary_in_map[key].node)
-            elif key in self._secondary_out_map:
-                node = self._secondary_out_map.pop(key).node
-                self._secondary_out_store.remove(node)
-
-                # Make room for key in primary queue
-                if len(self._primary_map) >= self._primary_size:
-                    self._primary_map.pop(self._primary_store.pop().key)
-
-                node = self._primary_store.append(key)
-                self._primary_map[key] = _NodeData(value, node)
+            primary_map = self._primary_map
+            secondary_in_map = self._secondary_in_map
+            secondary_out_map = self._secondary_out_map
+
+            if key in primary_map:
+                primary_map[key] = value
+                primary_map.move_to_end(key)
+            elif key in secondary_in_map:
+                secondary_in_map[key] = value
+                secondary_in_map.move_to_end(key)
+            elif secondary_out_map.pop(key, _sentinel) is not _sentinel:
+                self._promote(key, value)
             else:
                 # Make room for key in secondary "in" queue
-                if len(self._secondary_in_map) >= self._secondary_in_size:
-                    other_key = self._secondary_in_store.pop().key
-                    o = self._secondary_in_map.pop(other_key)
+                if len(secondary_in_map) >= self._secondary_in_size:
+                    other_key, other_value = secondary_in_map.popitem(last=False)
 
                     # Make room for other key in secondary "out" queue
-                    if len(self._secondary_out_map) >= self._secondary_out_size:
-                        self._secondary_out_map.pop(self._secondary_out_store.pop().key)
+                    if len(secondary_out_map) >= self._secondary_out_size:
+                        secondary_out_map.popitem(last=False)
+
+                    secondary_out_map[other_key] = other_value
+
+                secondary_in_map[key] = value
+
+    def _promote(self, key, value):
+        # Make room for key in primary queue
+        if len(self._primary_map) >= self._primary_size:
+            self._primary_map.popitem(last=False)
+
+        self._primary_map[key] = value
+
+
+# Decorator fast paths
+#
+# Wrappers specialized for the built-in caching algorithms, selected by `cache` based on the exact type of the
+# algorithm. A hit is served by reading the algorithm's storage directly under its lock, saving the `get` call and the
+# sentinel comparison of the generic `cache.run` path. Misses fall back to the generic miss handling. When neither a
+# `key_func` nor an `on_hit` callback is given, a leaner wrapper without those branches is returned, which also uses a
+# single argument of a fast type as the key itself without calling `create_key`, just as `create_key` would.
+def _make_map_wrapper(decorator, func):
+    algorithm = decorator.algorithm
+    lock = algorithm._lock
+    cache_map = algorithm._map
+    create_key = algorithm.create_key
+    key_func = decorator.key_func
+    typed = decorator.include_types
+    run_miss = decorator._run_miss
+    invoke_hit = decorator._invoke_hit
+
+    if key_func is None and invoke_hit is None:
+        fast_types = () if typed else _FAST_TYPES
+
+        def fast_wrapper(*args, **kwargs):
+            if len(args) == 1 and not kwargs and type(args[0]) in fast_types:
+                key = args[0]
+            else:
+                key = create_key(args, kwargs, typed)
+
+            with lock:
+                try:
+                    value = cache_map[key]
+                except KeyError:
+                    algorithm._misses += 1
+                else:
+                    algorithm._hits += 1
+                    return value
+            return run_miss(func, key, args, kwargs)
+
+        return fast_wrapper
+
+    def func_wrapper(*args, **kwargs):
+        if key_func is None:
+            key = create_key(args, kwargs, typed)
+        else:
+            key = create_key(*key_func(*args, **kwargs), typed)
+
+        with lock:
+            try:
+                value = cache_map[key]
+            except KeyError:
+                algorithm._misses += 1
+                value = _sentinel
+            else:
+                algorithm._hits += 1
+
+        if value is _sentinel:
+            return run_miss(func, key, args, kwargs)
+
+        if invoke_hit is not None:
+            invoke_hit(algorithm.hits, args, kwargs)
+        return value
+
+    return func_wrapper
+
+
+def _make_access_wrapper(decorator, func, access):
+    algorithm = decorator.algorithm
+    lock = algorithm._lock
+    cache_map = algorithm._map
+    create_key = algorithm.create_key
+    key_func = decorator.key_func
+    typed = decorator.include_types
+    run_miss = decorator._run_miss
+    invoke_hit = decorator._invoke_hit
+
+    if key_func is None and invoke_hit is None:
+        fast_types = () if typed else _FAST_TYPES
+
+        def fast_wrapper(*args, **kwargs):
+            if len(args) == 1 and not kwargs and type(args[0]) in fast_types:
+                key = args[0]
+            else:
+                key = create_key(args, kwargs, typed)
+
+            with lock:
+                try:
+                    value = cache_map[key]
+                except KeyError:
+                    algorithm._misses += 1
+                else:
+                    algorithm._hits += 1
+                    access(key)
+                    return value
+            return run_miss(func, key, args, kwargs)
+
+        return fast_wrapper
+
+    def func_wrapper(*args, **kwargs):
+        if key_func is None:
+            key = create_key(args, kwargs, typed)
+        else:
+            key = create_key(*key_func(*args, **kwargs), typed)
+
+        with lock:
+            try:
+                value = cache_map[key]
+            except KeyError:
+                algorithm._misses += 1
+                value = _sentinel
+            else:
+                algorithm._hits += 1
+                access(key)
+
+        if value is _sentinel:
+            return run_miss(func, key, args, kwargs)
+
+        if invoke_hit is not None:
+            invoke_hit(algorithm.hits, args, kwargs)
+        return value
+
+    return func_wrapper
+
+
+def _make_lfu_wrapper(decorator, func):
+    return _make_access_wrapper(decorator, func, decorator.algorithm._frequencies.access)
+
+
+def _make_lru_wrapper(decorator, func):
+    return _make_access_wrapper(decorator, func, decorator.algorithm._map.move_to_end)
+
+
+def _make_frequency_list_wrapper(decorator, func):
+    algorithm = decorator.algorithm
+    lock = algorithm._lock
+    cache_map = algorithm._map
+    access = algorithm._freq_list.access
+    create_key = algorithm.create_key
+    key_func = decorator.key_func
+    typed = decorator.include_types
+    run_miss = decorator._run_miss
+    invoke_hit = decorator._invoke_hit
+
+    if key_func is None and invoke_hit is None:
+        fast_types = () if typed else _FAST_TYPES
+
+        def fast_wrapper(*args, **kwargs):
+            if len(args) == 1 and not kwargs and type(args[0]) in fast_types:
+                key = args[0]
+            else:
+                key = create_key(args, kwargs, typed)
+
+            with lock:
+                try:
+                    data = cache_map[key]
+                except KeyError:
+                    algorithm._misses += 1
+                else:
+                    algorithm._hits += 1
+                    data.frequency_node = access(data.frequency_node, key)
+                    return data.value
+            return run_miss(func, key, args, kwargs)
+
+        return fast_wrapper
+
+    def func_wrapper(*args, **kwargs):
+        if key_func is None:
+            key = create_key(args, kwargs, typed)
+        else:
+            key = create_key(*key_func(*args, **kwargs), typed)
+
+        with lock:
+            try:
+                data = cache_map[key]
+            except KeyError:
+                algorithm._misses += 1
+                value = _sentinel
+            else:
+                algorithm._hits += 1
+                data.frequency_node = access(data.frequency_node, key)
+                value = data.value
+
+        if value is _sentinel:
+            return run_miss(func, key, args, kwargs)
+
+        if invoke_hit is not None:
+            invoke_hit(algorithm.hits, args, kwargs)
+        return value
+
+    return func_wrapper
+
+
+def _make_segmented_wrapper(decorator, func, cache_map):
+    algorithm = decorator.algorithm
+    lock = algorithm._lock
+    access = cache_map.move_to_end
+    get = algorithm.get
+    create_key = algorithm.create_key
+    key_func = decorator.key_func
+    typed = decorator.include_types
+    run_miss = decorator._run_miss
+    invoke_hit = decorator._invoke_hit
+
+    # Only hits on the 'hot' queue are served directly, other hits move items between queues so they go through `get`
+    if key_func is None and invoke_hit is None:
+        fast_types = () if typed else _FAST_TYPES
+
+        def fast_wrapper(*args, **kwargs):
+            if len(args) == 1 and not kwargs and type(args[0]) in fast_types:
+                key = args[0]
+            else:
+                key = create_key(args, kwargs, typed)
+
+            with lock:
+                try:
+                    value = cache_map[key]
+                except KeyError:
+                    pass
+                else:
+                    algorithm._hits += 1
+                    access(key)
+                    return value
+
+            value = get(key, _sentinel)
+            if value is _sentinel:
+                return run_miss(func, key, args, kwargs)
+            return value
+
+        return fast_wrapper
+
+    def func_wrapper(*args, **kwargs):
+        if key_func is None:
+            key = create_key(args, kwargs, typed)
+        else:
+            key = create_key(*key_func(*args, **kwargs), typed)
+
+        with lock:
+            try:
+                value = cache_map[key]
+            except KeyError:
+                value = _sentinel
+            else:
+                algorithm._hits += 1
+                access(key)
+
+        if value is _sentinel:
+            value = get(key, _sentinel)
+            if value is _sentinel:
+                return run_miss(func, key, args, kwargs)
+
+        if invoke_hit is not None:
+            invoke_hit(algorithm.hits, args, kwargs)
+        return value
+
+    return func_wrapper
+
+
+def _make_slru_wrapper(decorator, func):
+    return _make_segmented_wrapper(decorator, func, decorator.algorithm._protected_map)
+
+
+def _make_two_q_wrapper(decorator, func):
+    return _make_segmented_wrapper(decorator, func, decorator.algorithm._primary_map)
 
-                    other_node = self._secondary_out_store.append(other_key)
-                    self._secondary_out_map[other_key] = _NodeData(o.value, other_node)
 
-                node = self._secondary_in_store.append(key)
-                self._secondary_in_map[key] = _NodeData(value, node)
+_WRAPPER_FACTORIES = {
+    FIFOCache: _make_map_wrapper,
+    LIFOCache: _make_map_wrapper,
+    LFUCache: _make_lfu_wrapper,
+    LRUCache: _make_lru_wrapper,
+    MFUCache: _make_frequency_list_wrapper,
+    MRUCache: _make_lru_wrapper,
+    SLRUCache: _make_slru_wrapper,
+    TwoQCache: _make_two_q_wrapper,
+    TwoQFullCache: _make_two_q_wrapper,
+}
@@ -20,8 +20,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import gc
+import threading
 import unittest
-from unittest.mock import Mock
+import weakref
+from unittest.mock import Mock, patch
 from cachme import *
 
 
@@ -37,6 +40,93 @@ class NoCache(BaseCache):
     def put(self, key, value): pass
 
 
+class BasicCacheContract:
+    """Tests shared by the caches constructed from a single size."""
+
+    def make_cache(self, size):
+        raise NotImplementedError
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            self.make_cache(0)
+
+    def test_current_size_when_empty(self):
+        c = self.make_cache(1)
+        self.assertEqual(0, c.current_size)
+
+    def test_current_size_with_items(self):
+        c = self.make_cache(2)
+        c.put('key1', 1)
+        c.put('key2', 2)
+        self.assertEqual(2, c.current_size)
+
+    def test_current_size_with_full_cache(self):
+        c = self.make_cache(2)
+        c.put('key1', 1)
+        c.put('key2', 2)
+        c.put('key3', 3)
+        self.assertEqual(2, c.current_size)
+
+    def test_max_size(self):
+        c = self.make_cache(1)
+        self.assertEqual(1, c.max_size)
+
+    def test_hits_none(self):
+        c = self.make_cache(1)
+        c.get('key', object())
+        c.get('key', object())
+        self.assertEqual(0, c.hits)
+
+    def test_hits_some(self):
+        c = self.make_cache(2)
+        c.put('key', object())
+        c.get('key', object())
+        c.get('key', object())
+        self.assertEqual(2, c.hits)
+
+    def test_misses(self):
+        c = self.make_cache(1)
+        c.get('key', object())
+        c.get('key', object())
+        self.assertEqual(2, c.misses)
+
+    def test_misses_none(self):
+        c = self.make_cache(2)
+        c.put('key', object())
+        c.get('key', object())
+        c.get('key', object())
+        self.assertEqual(0, c.misses)
+
+    def test_get_key_in_cache(self):
+        c = self.make_cache(1)
+        c.put('key', 1)
+        out = c.get('key', object())
+        self.assertEqual(1, out)
+
+    def test_get_key_not_in_cache(self):
+        c = self.make_cache(1)
+        sentinel = object()
+        out = c.get('key', sentinel)
+        self.assertEqual(sentinel, out)
+
+    def test_put_key_in_cache(self):
+        c = self.make_cache(1)
+        c.put('key', 1)
+        out = c.get('key', object())
+        self.assertEqual(1, out)
+        self.assertEqual(1, c.hits)
+        self.assertEqual(0, c.misses)
+
+    def test_put_existing_key_in_cache(self):
+        c = self.make_cache(1)
+        c.put('key', 1)
+        c.put('key', 2)
+        out = c.get('key', object())
+        self.assertEqual(2, out)
+        self.assertEqual(1, c.hits)
+        self.assertEqual(0, c.misses)
+
+
 class TestCache(unittest.TestCase):
 
     def test_run_creates_key(self):
@@ -55,7 +145,7 @@ class TestCache(unittest.TestCase):
         self.assertEqual(0, out)
 
     def test_run_calls_func_if_not_in_cache(self):
-        def get(sentinel, key): return sentinel
+        def get(key, sentinel): return sentinel
 
         algo = Mock()
         algo.dynamic_methods = []
@@ -167,8 +257,30 @@ class TestCache(unittest.TestCase):
         cache(algo, on_hit=on_hit)(lambda x: x)(2)
         call.assert_called_once_with(1)
 
+    def test_on_hit_builtin_params(self):
+        algo = Mock()
+        algo.dynamic_methods = []
+        algo.hits = 4
+        hits = []
+
+        cache(algo, on_hit=hits.append)(lambda x: x)(2)
+        self.assertEqual([4], hits)
+
+    def test_callback_not_kept_alive(self):
+        class Counter:
+            def on_hit(self, hits):
+                pass
+
+        counter = Counter()
+        ref = weakref.ref(counter)
+        func = cache(LRUCache(1), on_hit=counter.on_hit)(lambda x: x)
+
+        del counter, func
+        gc.collect()
+        self.assertIsNone(ref())
+
     def test_on_miss_args(self):
-        def get(sentinel, key): return sentinel
+        def get(key, sentinel): return sentinel
         def func(*args, **kwargs): return 3
 
         call = Mock()
@@ -186,7 +298,7 @@ class TestCache(unittest.TestCase):
         call.assert_called_once_with(1)
 
     def test_on_miss_args_and_kwargs(self):
-        def get(sentinel, key): return sentinel
+        def get(key, sentinel): return sentinel
         def func(*args, **kwargs): return 3
 
         call = Mock()
@@ -206,7 +318,7 @@ class TestCache(unittest.TestCase):
         call.assert_called_once_with(1)
 
     def test_on_miss_kwarg_only_params(self):
-        def get(sentinel, key): return sentinel
+        def get(key, sentinel): return sentinel
 
         call = Mock()
         algo = Mock()
@@ -221,7 +333,7 @@ class TestCache(unittest.TestCase):
         call.assert_called_once_with(1)
 
     def test_on_miss_no_params(self):
-        def get(sentinel, key): return sentinel
+        def get(key, sentinel): return sentinel
 
         call = Mock()
         algo = Mock()
@@ -236,7 +348,7 @@ class TestCache(unittest.TestCase):
         call.assert_called_once_with()
 
     def test_on_miss_params(self):
-        def get(sentinel, key): return sentinel
+        def get(key, sentinel): return sentinel
 
         call = Mock()
         algo = Mock()
@@ -250,8 +362,68 @@ class TestCache(unittest.TestCase):
         cache(algo, on_miss=on_miss)(lambda x: x)(2)
         call.assert_called_once_with(1)
 
+    def test_on_hit_every(self):
+        hits = []
+        func = cache(LRUCache(2), on_hit=hits.append, on_hit_every=2)(lambda x: x)
+
+        for _ in range(6):
+            func(1)
+
+        self.assertEqual([2, 4], hits)
+
+    def test_on_miss_every(self):
+        misses = []
+        func = cache(LRUCache(2), on_miss=misses.append, on_miss_every=3)(lambda x: x)
+
+        for x in range(7):
+            func(x)
+
+        self.assertEqual([3, 6], misses)
+
+    def test_on_hit_every_with_shared_algorithm(self):
+        algo = LRUCache(4)
+        hits1 = []
+        hits2 = []
+        func1 = cache(algo, on_hit=hits1.append, on_hit_every=2)(lambda x: x)
+        func2 = cache(algo, on_hit=hits2.append, on_hit_every=2)(lambda x: -x)
+
+        func1(1)
+        func2(2)
+        for _ in range(3):
+            func1(1)
+            func2(2)
+            algo.get(1, object())
+
+        self.assertEqual([4], hits1)
+        self.assertEqual([5], hits2)
+
+    def test_on_hit_every_across_threads(self):
+        hits = []
+        func = cache(LRUCache(1), on_hit=hits.append, on_hit_every=3)(lambda x: x)
+        func(1)
+
+        def call():
+            for _ in range(300):
+                func(1)
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(400, len(hits))
+
+    def test_invalid_on_hit_every(self):
+        with self.assertRaises(ValueError):
+            cache(LRUCache(2), on_hit_every=0)
+
+    def test_invalid_on_miss_every(self):
+        with self.assertRaises(ValueError):
+            cache(LRUCache(2), on_miss_every=0)
+
     def test_miss_puts_key(self):
-        def get(sentinel, key): return sentinel
+        def get(key, sentinel): return sentinel
         def func(): return 3
 
         algo = Mock()
@@ -263,7 +435,7 @@ class TestCache(unittest.TestCase):
         algo.put.assert_called_once_with('key', 3)
 
     def test_func_with_args_only(self):
-        def get(sentinel, key): return sentinel
+        def get(key, sentinel): return sentinel
         def func(*args): return 3
 
         algo = Mock()
@@ -274,7 +446,7 @@ class TestCache(unittest.TestCase):
         self.assertEqual(3, out)
 
     def test_func_with_kwargs_only(self):
-        def get(sentinel, key): return sentinel
+        def get(key, sentinel): return sentinel
         def func(**kwargs): return 3
 
         algo = Mock()
@@ -285,7 +457,7 @@ class TestCache(unittest.TestCase):
         self.assertEqual(3, out)
 
     def test_func_with_args_and_kwargs(self):
-        def get(sentinel, key): return sentinel
+        def get(key, sentinel): return sentinel
         def func(*args, **kwargs): return 3
 
         algo = Mock()
@@ -302,6 +474,94 @@ class TestCache(unittest.TestCase):
         cache(algo, key_func=lambda x: ((0,), {}))(lambda x: x)(1)
         algo.create_key.assert_called_once_with((0,), {}, False)
 
+    def test_run_hits_cache(self):
+        func = Mock(return_value=3)
+        wrapped = cache(RRCache(2))(func)
+
+        self.assertEqual(3, wrapped(1))
+        self.assertEqual(3, wrapped(1))
+        self.assertEqual(1, func.call_count)
+        self.assertEqual((1, 1, 1, 2), wrapped.cache_info())
+
+    def test_fast_path_hits_cache(self):
+        for algo in [FIFOCache(2), LIFOCache(2), LFUCache(2), LRUCache(2), MFUCache(2), MRUCache(2)]:
+            func = Mock(return_value=3)
+            wrapped = cache(algo)(func)
+
+            self.assertEqual(3, wrapped(1))
+            self.assertEqual(3, wrapped(1))
+            self.assertEqual(1, func.call_count)
+            self.assertEqual((1, 1, 1, 2), wrapped.cache_info())
+
+    def test_fast_path_on_hit_and_on_miss(self):
+        on_hit = Mock()
+        on_miss = Mock()
+
+        def hit(hits, *args, **kwargs): on_hit(hits, *args, **kwargs)
+        def miss(misses, *args, **kwargs): on_miss(misses, *args, **kwargs)
+
+        wrapped = cache(LRUCache(2), on_hit=hit, on_miss=miss)(lambda x, y=0: x + y)
+        wrapped(1, y=2)
+        wrapped(1, y=2)
+
+        on_miss.assert_called_once_with(1, 1, y=2)
+        on_hit.assert_called_once_with(1, 1, y=2)
+
+    def test_fast_path_key_func(self):
+        func = Mock(return_value=3)
+        wrapped = cache(LRUCache(2), key_func=lambda x: ((0,), {}))(func)
+
+        wrapped(1)
+        wrapped(2)
+        self.assertEqual(1, func.call_count)
+
+    def test_fast_path_segmented_hits_cache(self):
+        for algo in [SLRUCache(1, 1), TwoQCache(1, 1), TwoQFullCache(1, 1, 1)]:
+            func = Mock(side_effect=lambda x: x * 3)
+            wrapped = cache(algo)(func)
+
+            # Hits in every queue, including promotions into the 'hot' queue
+            for x in [1, 1, 2, 1, 2, 3, 1, 3]:
+                self.assertEqual(x * 3, wrapped(x))
+
+            self.assertEqual(algo.misses, func.call_count)
+            self.assertEqual(8, algo.hits + algo.misses)
+
+    def test_fast_path_single_argument_key(self):
+        algo = LRUCache(2)
+        func = Mock(return_value=3)
+        wrapped = cache(algo)(func)
+
+        wrapped(1)
+        wrapped(1.0)
+        self.assertEqual(1, func.call_count)
+        self.assertEqual(3, algo.get(1, object()))
+
+    def test_fast_path_single_argument_typed_key(self):
+        func = Mock(return_value=3)
+        wrapped = cache(LRUCache(2), include_types=True)(func)
+
+        wrapped(1)
+        wrapped(1.0)
+        self.assertEqual(2, func.call_count)
+
+    def test_algorithms_not_thread_safe(self):
+        algos = [ClockCache(2, thread_safe=False), FIFOCache(2, thread_safe=False), LIFOCache(2, thread_safe=False),
+                 LFUCache(2, thread_safe=False), LRUCache(2, thread_safe=False), MFUCache(2, thread_safe=False),
+                 MQCache(2, 1, 1, thread_safe=False),
+                 MRUCache(2, thread_safe=False), NMRUCache(2, thread_safe=False), RRCache(2, thread_safe=False),
+                 SLRUCache(1, 1, thread_safe=False), StaticCache(thread_safe=False),
+                 TLRUCache(2, 2, thread_safe=False), TwoQCache(1, 1, thread_safe=False),
+                 TwoQFullCache(1, 1, 1, thread_safe=False)]
+
+        for algo in algos:
+            func = Mock(return_value=3)
+            wrapped = cache(algo)(func)
+
+            self.assertEqual(3, wrapped(1))
+            self.assertEqual(3, wrapped(1))
+            self.assertEqual(1, func.call_count)
+
 
 class TestBaseCache(unittest.TestCase):
 
@@ -309,7 +569,7 @@ class TestBaseCache(unittest.TestCase):
         obj = object()
         expected = [1, 2, 3, obj]
         actual = NoCache().create_key((1, 2, 3, obj), {})
-        self.assertEqual(expected, actual)
+        self.assertEqual(expected, list(actual))
 
     def test_dynamic_methods(self):
         actual = NoCache().dynamic_methods
@@ -318,92 +578,109 @@ class TestBaseCache(unittest.TestCase):
     def test_create_key_kwargs_only(self):
         expected = ['a', 1, 'b', 2]
         actual = NoCache().create_key((), kwargs={'a': 1, 'b': 2}, kwarg_mark=())
-        self.assertEqual(expected, actual)
+        self.assertEqual(expected, list(actual))
 
     def test_create_key_args_and_kwargs(self):
         obj = object()
         expected = [1, 2, 3, obj, 'a', 4, 'b', 5]
         actual = NoCache().create_key((1, 2, 3, obj), {'a': 4, 'b': 5}, kwarg_mark=())
-        self.assertEqual(expected, actual)
+        self.assertEqual(expected, list(actual))
 
     def test_create_key_fasttypes(self):
         expected = 1
         actual = NoCache().create_key((1,), {})
         self.assertEqual(expected, actual)
 
+    def test_create_key_fasttypes_tuple(self):
+        expected = (1, 2.5, 'a', None)
+        actual = NoCache().create_key((1, 2.5, 'a', None), {})
+        self.assertEqual(expected, actual)
+
     def test_create_key_args_typed(self):
         obj = object()
         expected = [1, 2, 3, obj, int, int, int, object]
         actual = NoCache().create_key((1, 2, 3, obj), {}, typed=True)
-        self.assertEqual(expected, actual)
+        self.assertEqual(expected, list(actual))
 
     def test_create_key_kwargs_typed(self):
         expected = ['a', 1, 'b', 2, int, int]
         actual = NoCache().create_key((), {'a': 1, 'b': 2}, typed=True, kwarg_mark=())
-        self.assertEqual(expected, actual)
+        self.assertEqual(expected, list(actual))
 
     def test_create_key_rehashes_correctly(self):
         actual = NoCache().create_key((), kwargs={'a': 1, 'b': 2}, kwarg_mark=())
         self.assertEqual(hash(actual), hash(actual))
 
 
-class TestFIFOCache(unittest.TestCase):
+class TestClockCache(BasicCacheContract, unittest.TestCase):
 
-    def test_invalid_size(self):
-        with self.assertRaises(ValueError):
-            FIFOCache(0)
+    def make_cache(self, size):
+        return ClockCache(size)
 
-    def test_current_size_when_empty(self):
-        fc = FIFOCache(1)
-        self.assertEqual(0, fc.current_size)
-
-    def test_current_size_with_items(self):
-        fc = FIFOCache(2)
-        fc.put('key1', 1)
-        fc.put('key2', 2)
-        self.assertEqual(2, fc.current_size)
+    def test_clear_with_empty_cache(self):
+        cc = ClockCache(1)
+        cc.clear()
+        self.assertEqual({}, cc._index)
+        self.assertEqual(0, cc.hits)
+        self.assertEqual(0, cc.misses)
 
-    def test_current_size_with_full_cache(self):
-        fc = FIFOCache(2)
-        fc.put('key1', 1)
-        fc.put('key2', 2)
-        self.assertEqual(2, fc.current_size)
+    def test_clear_with_items(self):
+        cc = ClockCache(1)
+        cc.put('key1', 1)
+        cc.put('key2', 2)
+        cc.clear()
+        self.assertEqual({}, cc._index)
+        self.assertEqual([], cc._keys)
+        self.assertEqual(0, cc.hits)
+        self.assertEqual(0, cc.misses)
 
-    def test_max_size(self):
-        fc = FIFOCache(1)
-        self.assertEqual(1, fc.max_size)
+    def test_key_evicts_when_full(self):
+        sentinel = object()
+        cc = ClockCache(1)
+        cc.put('key1', 1)
+        cc.put('key2', 2)
+        out1 = cc.get('key1', sentinel)
+        out2 = cc.get('key2', sentinel)
+        self.assertEqual(sentinel, out1)
+        self.assertEqual(2, out2)
 
-    def test_hits_none(self):
-        fc = FIFOCache(1)
-        fc.get('key', object())
-        fc.get('key', object())
-        self.assertEqual(0, fc.hits)
+    def test_key_evicts_unreferenced(self):
+        sentinel = object()
+        cc = ClockCache(3)
+        cc.put('key1', 1)
+        cc.put('key2', 2)
+        cc.put('key3', 3)
+        out1 = cc.get('key1', sentinel)
+        out2 = cc.get('key3', sentinel)
+
+        # key2 should be evicted, only key1 loses its reference bit
+        cc.put('key4', 4)
+        out3 = cc.get('key2', sentinel)
+
+        # key1 should be evicted, key3 losing its reference bit on the way
+        cc.put('key5', 5)
+        out4 = cc.get('key1', sentinel)
+        out5 = cc.get('key3', sentinel)
+        out6 = cc.get('key4', sentinel)
+        out7 = cc.get('key5', sentinel)
+        self.assertEqual(1, out1)
+        self.assertEqual(3, out2)
+        self.assertEqual(sentinel, out3)
+        self.assertEqual(sentinel, out4)
+        self.assertEqual(3, out5)
+        self.assertEqual(4, out6)
+        self.assertEqual(5, out7)
 
-    def test_hits_some(self):
-        fc = FIFOCache(2)
-        fc.put('key', object())
-        fc.get('key', object())
-        fc.get('key', object())
-        self.assertEqual(2, fc.hits)
 
-    def test_misses(self):
-        fc = FIFOCache(1)
-        fc.get('key', object())
-        fc.get('key', object())
-        self.assertEqual(2, fc.misses)
+class TestFIFOCache(BasicCacheContract, unittest.TestCase):
 
-    def test_misses_none(self):
-        fc = FIFOCache(2)
-        fc.put('key', object())
-        fc.get('key', object())
-        fc.get('key', object())
-        self.assertEqual(0, fc.misses)
+    def make_cache(self, size):
+        return FIFOCache(size)
 
     def test_clear_with_empty_cache(self):
         fc = FIFOCache(1)
         fc.clear()
         self.assertEqual({}, fc._map)
-        self.assertEqual(0, len(fc._queue))
         self.assertEqual(0, fc.hits)
         self.assertEqual(0, fc.misses)
 
@@ -413,39 +690,9 @@ class TestFIFOCache(unittest.TestCase):
         fc.put('key2', 2)
         fc.clear()
         self.assertEqual({}, fc._map)
-        self.assertEqual(0, len(fc._queue))
         self.assertEqual(0, fc.hits)
         self.assertEqual(0, fc.misses)
 
-    def test_get_key_in_cache(self):
-        fc = FIFOCache(1)
-        fc.put('key', 1)
-        out = fc.get('key', object())
-        self.assertEqual(1, out)
-
-    def test_get_key_not_in_cache(self):
-        fc = FIFOCache(1)
-        sentinel = object()
-        out = fc.get('key', sentinel)
-        self.assertEqual(sentinel, out)
-
-    def test_put_key_in_cache(self):
-        fc = FIFOCache(1)
-        fc.put('key', 1)
-        out = fc.get('key', object())
-        self.assertEqual(1, out)
-        self.assertEqual(1, fc.hits)
-        self.assertEqual(0, fc.misses)
-
-    def test_put_existing_key_in_cache(self):
-        fc = FIFOCache(1)
-        fc.put('key', 1)
-        fc.put('key', 2)
-        out = fc.get('key', object())
-        self.assertEqual(2, out)
-        self.assertEqual(1, fc.hits)
-        self.assertEqual(0, fc.misses)
-
     def test_key_evicts_when_full(self):
         sentinel = object()
         fc = FIFOCache(2)
@@ -468,64 +715,26 @@ class TestFIFOCache(unittest.TestCase):
         self.assertEqual(4, out4)
         self.assertEqual(sentinel, out5)
 
+    def test_key_evicts_batch_when_full(self):
+        sentinel = object()
+        fc = FIFOCache(128)
+        for i in range(128):
+            fc.put(i, i)
+        fc.put(128, 128)
+        evicted = [i for i in range(129) if fc.get(i, sentinel) is sentinel]
+        self.assertEqual(127, fc.current_size)
+        self.assertEqual([0, 1], evicted)
 
-class TestLIFOCache(unittest.TestCase):
-
-    def test_invalid_size(self):
-        with self.assertRaises(ValueError):
-            LIFOCache(0)
-
-    def test_current_size_when_empty(self):
-        lc = LIFOCache(1)
-        self.assertEqual(0, lc.current_size)
-
-    def test_current_size_with_items(self):
-        lc = LIFOCache(2)
-        lc.put('key1', 1)
-        lc.put('key2', 2)
-        self.assertEqual(2, lc.current_size)
-
-    def test_current_size_with_full_cache(self):
-        lc = LIFOCache(2)
-        lc.put('key1', 1)
-        lc.put('key2', 2)
-        self.assertEqual(2, lc.current_size)
-
-    def test_max_size(self):
-        lc = LIFOCache(1)
-        self.assertEqual(1, lc.max_size)
-
-    def test_hits_none(self):
-        lc = LIFOCache(1)
-        lc.get('key', object())
-        lc.get('key', object())
-        self.assertEqual(0, lc.hits)
-
-    def test_hits_some(self):
-        lc = LIFOCache(2)
-        lc.put('key', object())
-        lc.get('key', object())
-        lc.get('key', object())
-        self.assertEqual(2, lc.hits)
 
-    def test_misses(self):
-        lc = LIFOCache(1)
-        lc.get('key', object())
-        lc.get('key', object())
-        self.assertEqual(2, lc.misses)
+class TestLIFOCache(BasicCacheContract, unittest.TestCase):
 
-    def test_misses_none(self):
-        lc = LIFOCache(2)
-        lc.put('key', object())
-        lc.get('key', object())
-        lc.get('key', object())
-        self.assertEqual(0, lc.misses)
+    def make_cache(self, size):
+        return LIFOCache(size)
 
     def test_clear_with_empty_cache(self):
         lc = LIFOCache(1)
         lc.clear()
         self.assertEqual({}, lc._map)
-        self.assertEqual(0, len(lc._queue))
         self.assertEqual(0, lc.hits)
         self.assertEqual(0, lc.misses)
 
@@ -535,39 +744,9 @@ class TestLIFOCache(unittest.TestCase):
         lc.put('key2', 2)
         lc.clear()
         self.assertEqual({}, lc._map)
-        self.assertEqual(0, len(lc._queue))
         self.assertEqual(0, lc.hits)
         self.assertEqual(0, lc.misses)
 
-    def test_get_key_in_cache(self):
-        lc = LIFOCache(1)
-        lc.put('key', 1)
-        out = lc.get('key', object())
-        self.assertEqual(1, out)
-
-    def test_get_key_not_in_cache(self):
-        lc = LIFOCache(1)
-        sentinel = object()
-        out = lc.get('key', sentinel)
-        self.assertEqual(sentinel, out)
-
-    def test_put_key_in_cache(self):
-        lc = LIFOCache(1)
-        lc.put('key', 1)
-        out = lc.get('key', object())
-        self.assertEqual(1, out)
-        self.assertEqual(1, lc.hits)
-        self.assertEqual(0, lc.misses)
-
-    def test_put_existing_key_in_cache(self):
-        lc = LIFOCache(1)
-        lc.put('key', 1)
-        lc.put('key', 2)
-        out = lc.get('key', object())
-        self.assertEqual(2, out)
-        self.assertEqual(1, lc.hits)
-        self.assertEqual(0, lc.misses)
-
     def test_key_evicts_when_full(self):
         sentinel = object()
         lc = LIFOCache(2)
@@ -591,63 +770,16 @@ class TestLIFOCache(unittest.TestCase):
         self.assertEqual(1, out5)
 
 
-class TestLFUCache(unittest.TestCase):
-
-    def test_invalid_size(self):
-        with self.assertRaises(ValueError):
-            LFUCache(0)
-
-    def test_current_size_when_empty(self):
-        lc = LFUCache(1)
-        self.assertEqual(0, lc.current_size)
+class TestLFUCache(BasicCacheContract, unittest.TestCase):
 
-    def test_current_size_with_items(self):
-        lc = LFUCache(2)
-        lc.put('key1', 1)
-        lc.put('key2', 2)
-        self.assertEqual(2, lc.current_size)
-
-    def test_current_size_with_full_cache(self):
-        lc = LFUCache(2)
-        lc.put('key1', 1)
-        lc.put('key2', 2)
-        self.assertEqual(2, lc.current_size)
-
-    def test_max_size(self):
-        lc = LFUCache(1)
-        self.assertEqual(1, lc.max_size)
-
-    def test_hits_none(self):
-        lc = LFUCache(1)
-        lc.get('key', object())
-        lc.get('key', object())
-        self.assertEqual(0, lc.hits)
-
-    def test_hits_some(self):
-        lc = LFUCache(2)
-        lc.put('key', object())
-        lc.get('key', object())
-        lc.get('key', object())
-        self.assertEqual(2, lc.hits)
-
-    def test_misses(self):
-        lc = LFUCache(1)
-        lc.get('key', object())
-        lc.get('key', object())
-        self.assertEqual(2, lc.misses)
-
-    def test_misses_none(self):
-        lc = LFUCache(2)
-        lc.put('key', object())
-        lc.get('key', object())
-        lc.get('key', object())
-        self.assertEqual(0, lc.misses)
+    def make_cache(self, size):
+        return LFUCache(size)
 
     def test_clear_with_empty_cache(self):
         lc = LFUCache(1)
         lc.clear()
         self.assertEqual({}, lc._map)
-        self.assertEqual(0, len(lc._freq_list))
+        self.assertEqual(0, len(lc._frequencies))
         self.assertEqual(0, lc.hits)
         self.assertEqual(0, lc.misses)
 
@@ -657,39 +789,10 @@ class TestLFUCache(unittest.TestCase):
         lc.put('key2', 2)
         lc.clear()
         self.assertEqual({}, lc._map)
-        self.assertEqual(0, len(lc._freq_list))
+        self.assertEqual(0, len(lc._frequencies))
         self.assertEqual(0, lc.hits)
         self.assertEqual(0, lc.misses)
 
-    def test_get_key_in_cache(self):
-        lc = LFUCache(1)
-        lc.put('key', 1)
-        out = lc.get('key', object())
-        self.assertEqual(1, out)
-
-    def test_get_key_not_in_cache(self):
-        lc = LFUCache(1)
-        sentinel = object()
-        out = lc.get('key', sentinel)
-        self.assertEqual(sentinel, out)
-
-    def test_put_key_in_cache(self):
-        lc = LFUCache(1)
-        lc.put('key', 1)
-        out = lc.get('key', object())
-        self.assertEqual(1, out)
-        self.assertEqual(1, lc.hits)
-        self.assertEqual(0, lc.misses)
-
-    def test_put_existing_key_in_cache(self):
-        lc = LFUCache(1)
-        lc.put('key', 1)
-        lc.put('key', 2)
-        out = lc.get('key', object())
-        self.assertEqual(2, out)
-        self.assertEqual(1, lc.hits)
-        self.assertEqual(0, lc.misses)
-
     def test_key_evicts_when_full(self):
         sentinel = object()
         lc = LFUCache(1)
@@ -747,64 +850,53 @@ class TestLFUCache(unittest.TestCase):
 
         self.assertEqual(1, len({1, 2, 3}.difference({out1, out2, out3})))
 
-
-class TestLRUCache(unittest.TestCase):
-
-    def test_invalid_size(self):
-        with self.assertRaises(ValueError):
-            LRUCache(0)
-
-    def test_current_size_when_empty(self):
-        lc = LRUCache(1)
-        self.assertEqual(0, lc.current_size)
-
-    def test_current_size_with_items(self):
-        lc = LRUCache(2)
-        lc.put('key1', 1)
-        lc.put('key2', 2)
-        self.assertEqual(2, lc.current_size)
-
-    def test_current_size_with_full_cache(self):
-        lc = LRUCache(2)
+    def test_key_evicts_batch_when_full(self):
+        sentinel = object()
+        lc = LFUCache(128)
+        for i in range(128):
+            lc.put(i, i)
+        lc.put(128, 128)
+        evicted = [i for i in range(129) if lc.get(i, sentinel) is sentinel]
+        self.assertEqual(127, lc.current_size)
+        self.assertEqual([0, 1], evicted)
+
+    def test_key_evicts_batch_across_frequencies(self):
+        sentinel = object()
+        lc = LFUCache(128)
+        for i in range(128):
+            lc.put(i, i)
+        for i in range(1, 128):
+            lc.get(i, sentinel)
+
+        # Key 0 is alone in the lowest frequency bucket, so the batch continues into the next one
+        lc.put(128, 128)
+        evicted = [i for i in range(129) if lc.get(i, sentinel) is sentinel]
+        self.assertEqual(127, lc.current_size)
+        self.assertEqual([0, 1], evicted)
+
+    def test_key_evicts_oldest_if_tie(self):
+        sentinel = object()
+        lc = LFUCache(2)
         lc.put('key1', 1)
         lc.put('key2', 2)
-        self.assertEqual(2, lc.current_size)
-
-    def test_max_size(self):
-        lc = LRUCache(1)
-        self.assertEqual(1, lc.max_size)
-
-    def test_hits_none(self):
-        lc = LRUCache(1)
-        lc.get('key', object())
-        lc.get('key', object())
-        self.assertEqual(0, lc.hits)
+        lc.put('key3', 3)
+        out1 = lc.get('key1', sentinel)
+        out2 = lc.get('key2', sentinel)
+        out3 = lc.get('key3', sentinel)
+        self.assertEqual(sentinel, out1)
+        self.assertEqual(2, out2)
+        self.assertEqual(3, out3)
 
-    def test_hits_some(self):
-        lc = LRUCache(2)
-        lc.put('key', object())
-        lc.get('key', object())
-        lc.get('key', object())
-        self.assertEqual(2, lc.hits)
 
-    def test_misses(self):
-        lc = LRUCache(1)
-        lc.get('key', object())
-        lc.get('key', object())
-        self.assertEqual(2, lc.misses)
+class TestLRUCache(BasicCacheContract, unittest.TestCase):
 
-    def test_misses_none(self):
-        lc = LRUCache(2)
-        lc.put('key', object())
-        lc.get('key', object())
-        lc.get('key', object())
-        self.assertEqual(0, lc.misses)
+    def make_cache(self, size):
+        return LRUCache(size)
 
     def test_clear_with_empty_cache(self):
         lc = LRUCache(1)
         lc.clear()
         self.assertEqual({}, lc._map)
-        self.assertEqual(0, len(lc._queue))
         self.assertEqual(0, lc.hits)
         self.assertEqual(0, lc.misses)
 
@@ -814,39 +906,9 @@ class TestLRUCache(unittest.TestCase):
         lc.put('key2', 2)
         lc.clear()
         self.assertEqual({}, lc._map)
-        self.assertEqual(0, len(lc._queue))
         self.assertEqual(0, lc.hits)
         self.assertEqual(0, lc.misses)
 
-    def test_get_key_in_cache(self):
-        lc = LRUCache(1)
-        lc.put('key', 1)
-        out = lc.get('key', object())
-        self.assertEqual(1, out)
-
-    def test_get_key_not_in_cache(self):
-        lc = LRUCache(1)
-        sentinel = object()
-        out = lc.get('key', sentinel)
-        self.assertEqual(sentinel, out)
-
-    def test_put_key_in_cache(self):
-        lc = LRUCache(1)
-        lc.put('key', 1)
-        out = lc.get('key', object())
-        self.assertEqual(1, out)
-        self.assertEqual(1, lc.hits)
-        self.assertEqual(0, lc.misses)
-
-    def test_put_existing_key_in_cache(self):
-        lc = LRUCache(1)
-        lc.put('key', 1)
-        lc.put('key', 2)
-        out = lc.get('key', object())
-        self.assertEqual(2, out)
-        self.assertEqual(1, lc.hits)
-        self.assertEqual(0, lc.misses)
-
     def test_key_evicts_when_full(self):
         sentinel = object()
         lc = LRUCache(1)
@@ -881,63 +943,27 @@ class TestLRUCache(unittest.TestCase):
         self.assertEqual(1, out2)
         self.assertEqual(2, out3)
         self.assertEqual(1, out4)
-        self.assertEqual(sentinel, out5)
-        self.assertEqual(sentinel, out6)
-        self.assertEqual(4, out7)
-        self.assertEqual(5, out8)
-
-
-class TestMFUCache(unittest.TestCase):
-
-    def test_invalid_size(self):
-        with self.assertRaises(ValueError):
-            MFUCache(0)
-
-    def test_current_size_when_empty(self):
-        mc = MFUCache(1)
-        self.assertEqual(0, mc.current_size)
-
-    def test_current_size_with_items(self):
-        mc = MFUCache(2)
-        mc.put('key1', 1)
-        mc.put('key2', 2)
-        self.assertEqual(2, mc.current_size)
-
-    def test_current_size_with_full_cache(self):
-        mc = MFUCache(2)
-        mc.put('key1', 1)
-        mc.put('key2', 2)
-        self.assertEqual(2, mc.current_size)
-
-    def test_max_size(self):
-        mc = MFUCache(1)
-        self.assertEqual(1, mc.max_size)
+        self.assertEqual(sentinel, out5)
+        self.assertEqual(sentinel, out6)
+        self.assertEqual(4, out7)
+        self.assertEqual(5, out8)
 
-    def test_hits_none(self):
-        mc = MFUCache(1)
-        mc.get('key', object())
-        mc.get('key', object())
-        self.assertEqual(0, mc.hits)
+    def test_key_evicts_batch_when_full(self):
+        sentinel = object()
+        lc = LRUCache(128)
+        for i in range(128):
+            lc.put(i, i)
+        lc.get(0, sentinel)
+        lc.put(128, 128)
+        evicted = [i for i in range(129) if lc.get(i, sentinel) is sentinel]
+        self.assertEqual(127, lc.current_size)
+        self.assertEqual([1, 2], evicted)
 
-    def test_hits_some(self):
-        mc = MFUCache(2)
-        mc.put('key', object())
-        mc.get('key', object())
-        mc.get('key', object())
-        self.assertEqual(2, mc.hits)
 
-    def test_misses(self):
-        mc = MFUCache(1)
-        mc.get('key', object())
-        mc.get('key', object())
-        self.assertEqual(2, mc.misses)
+class TestMFUCache(BasicCacheContract, unittest.TestCase):
 
-    def test_misses_none(self):
-        mc = MFUCache(2)
-        mc.put('key', object())
-        mc.get('key', object())
-        mc.get('key', object())
-        self.assertEqual(0, mc.misses)
+    def make_cache(self, size):
+        return MFUCache(size)
 
     def test_clear_with_empty_cache(self):
         mc = MFUCache(1)
@@ -957,35 +983,6 @@ class TestMFUCache(unittest.TestCase):
         self.assertEqual(0, mc.hits)
         self.assertEqual(0, mc.misses)
 
-    def test_get_key_in_cache(self):
-        mc = MFUCache(1)
-        mc.put('key', 1)
-        out = mc.get('key', object())
-        self.assertEqual(1, out)
-
-    def test_get_key_not_in_cache(self):
-        mc = MFUCache(1)
-        sentinel = object()
-        out = mc.get('key', sentinel)
-        self.assertEqual(sentinel, out)
-
-    def test_put_key_in_cache(self):
-        mc = MFUCache(1)
-        mc.put('key', 1)
-        out = mc.get('key', object())
-        self.assertEqual(1, out)
-        self.assertEqual(1, mc.hits)
-        self.assertEqual(0, mc.misses)
-
-    def test_put_existing_key_in_cache(self):
-        mc = MFUCache(1)
-        mc.put('key', 1)
-        mc.put('key', 2)
-        out = mc.get('key', object())
-        self.assertEqual(2, out)
-        self.assertEqual(1, mc.hits)
-        self.assertEqual(0, mc.misses)
-
     def test_key_evicts_when_full(self):
         sentinel = object()
         mc = MFUCache(1)
@@ -1034,6 +1031,42 @@ class TestMFUCache(unittest.TestCase):
 
         self.assertEqual(1, len({1, 2, 3}.difference({out1, out2, out3})))
 
+    def test_key_evicts_batch_when_full(self):
+        sentinel = object()
+        mc = MFUCache(128)
+        for i in range(128):
+            mc.put(i, i)
+        mc.put(128, 128)
+        evicted = [i for i in range(129) if mc.get(i, sentinel) is sentinel]
+        self.assertEqual(127, mc.current_size)
+        self.assertEqual([0, 1], evicted)
+
+    def test_key_evicts_batch_across_frequencies(self):
+        sentinel = object()
+        mc = MFUCache(128)
+        for i in range(128):
+            mc.put(i, i)
+        mc.get(0, sentinel)
+
+        # Key 0 is alone in the highest frequency bucket, so the batch continues into the next one
+        mc.put(128, 128)
+        evicted = [i for i in range(129) if mc.get(i, sentinel) is sentinel]
+        self.assertEqual(127, mc.current_size)
+        self.assertEqual([0, 1], evicted)
+
+    def test_key_evicts_oldest_if_tie(self):
+        sentinel = object()
+        mc = MFUCache(2)
+        mc.put('key1', 1)
+        mc.put('key2', 2)
+        mc.put('key3', 3)
+        out1 = mc.get('key1', sentinel)
+        out2 = mc.get('key2', sentinel)
+        out3 = mc.get('key3', sentinel)
+        self.assertEqual(sentinel, out1)
+        self.assertEqual(2, out2)
+        self.assertEqual(3, out3)
+
 
 class TestMQCache(unittest.TestCase):
 
@@ -1105,10 +1138,7 @@ class TestMQCache(unittest.TestCase):
         mc.clear()
         self.assertEqual({}, mc._map)
         self.assertEqual({}, mc._buffer_map)
-
-        for i in range(mc._num_queues):
-            self.assertEqual(0, len(mc._queues[i]))
-
+        self.assertEqual([0] * mc._num_queues, [len(queue) for queue in mc._queues])
         self.assertEqual(0, mc.hits)
         self.assertEqual(0, mc.misses)
 
@@ -1119,10 +1149,7 @@ class TestMQCache(unittest.TestCase):
         mc.clear()
         self.assertEqual({}, mc._map)
         self.assertEqual({}, mc._buffer_map)
-
-        for i in range(mc._num_queues):
-            self.assertEqual(0, len(mc._queues[i]))
-
+        self.assertEqual([0] * mc._num_queues, [len(queue) for queue in mc._queues])
         self.assertEqual(0, mc.hits)
         self.assertEqual(0, mc.misses)
 
@@ -1224,64 +1251,26 @@ class TestMQCache(unittest.TestCase):
         self.assertEqual(4, out8)
         self.assertEqual(5, out9)
 
+    def test_queue_func_places_key(self):
+        mc = MQCache(1, 1, 1, num_queues=4, queue_func=lambda f: f % 3)
+        mc.put('key', 1)
+        self.assertEqual(1, mc._map['key'].queue)
 
-class TestMRUCache(unittest.TestCase):
-
-    def test_invalid_size(self):
-        with self.assertRaises(ValueError):
-            MRUCache(0)
-
-    def test_current_size_when_empty(self):
-        mc = MRUCache(1)
-        self.assertEqual(0, mc.current_size)
-
-    def test_current_size_with_items(self):
-        mc = MRUCache(2)
-        mc.put('key1', 1)
-        mc.put('key2', 2)
-        self.assertEqual(2, mc.current_size)
-
-    def test_current_size_with_full_cache(self):
-        mc = MRUCache(2)
-        mc.put('key1', 1)
-        mc.put('key2', 2)
-        self.assertEqual(2, mc.current_size)
-
-    def test_max_size(self):
-        mc = MRUCache(1)
-        self.assertEqual(1, mc.max_size)
-
-    def test_hits_none(self):
-        mc = MRUCache(1)
-        mc.get('key', object())
-        mc.get('key', object())
-        self.assertEqual(0, mc.hits)
+        # Frequencies past the precomputed table still use queue_func
+        for frequency in range(2, 2000):
+            mc.get('key', object())
+            self.assertEqual(frequency % 3, mc._map['key'].queue)
 
-    def test_hits_some(self):
-        mc = MRUCache(2)
-        mc.put('key', object())
-        mc.get('key', object())
-        mc.get('key', object())
-        self.assertEqual(2, mc.hits)
 
-    def test_misses(self):
-        mc = MRUCache(1)
-        mc.get('key', object())
-        mc.get('key', object())
-        self.assertEqual(2, mc.misses)
+class TestMRUCache(BasicCacheContract, unittest.TestCase):
 
-    def test_misses_none(self):
-        mc = MRUCache(2)
-        mc.put('key', object())
-        mc.get('key', object())
-        mc.get('key', object())
-        self.assertEqual(0, mc.misses)
+    def make_cache(self, size):
+        return MRUCache(size)
 
     def test_clear_with_empty_cache(self):
         mc = MRUCache(1)
         mc.clear()
         self.assertEqual({}, mc._map)
-        self.assertEqual(0, len(mc._queue))
         self.assertEqual(0, mc.hits)
         self.assertEqual(0, mc.misses)
 
@@ -1291,39 +1280,9 @@ class TestMRUCache(unittest.TestCase):
         mc.put('key2', 2)
         mc.clear()
         self.assertEqual({}, mc._map)
-        self.assertEqual(0, len(mc._queue))
         self.assertEqual(0, mc.hits)
         self.assertEqual(0, mc.misses)
 
-    def test_get_key_in_cache(self):
-        mc = MRUCache(1)
-        mc.put('key', 1)
-        out = mc.get('key', object())
-        self.assertEqual(1, out)
-
-    def test_get_key_not_in_cache(self):
-        mc = MRUCache(1)
-        sentinel = object()
-        out = mc.get('key', sentinel)
-        self.assertEqual(sentinel, out)
-
-    def test_put_key_in_cache(self):
-        mc = MRUCache(1)
-        mc.put('key', 1)
-        out = mc.get('key', object())
-        self.assertEqual(1, out)
-        self.assertEqual(1, mc.hits)
-        self.assertEqual(0, mc.misses)
-
-    def test_put_existing_key_in_cache(self):
-        mc = MRUCache(1)
-        mc.put('key', 1)
-        mc.put('key', 2)
-        out = mc.get('key', object())
-        self.assertEqual(2, out)
-        self.assertEqual(1, mc.hits)
-        self.assertEqual(0, mc.misses)
-
     def test_key_evicts_when_full(self):
         sentinel = object()
         mc = MRUCache(1)
@@ -1363,57 +1322,10 @@ class TestMRUCache(unittest.TestCase):
         self.assertEqual(sentinel, out8)
 
 
-class TestNMRUCache(unittest.TestCase):
-
-    def test_invalid_size(self):
-        with self.assertRaises(ValueError):
-            NMRUCache(0)
-
-    def test_current_size_when_empty(self):
-        nc = NMRUCache(1)
-        self.assertEqual(0, nc.current_size)
-
-    def test_current_size_with_items(self):
-        nc = NMRUCache(2)
-        nc.put('key1', 1)
-        nc.put('key2', 2)
-        self.assertEqual(2, nc.current_size)
-
-    def test_current_size_with_full_cache(self):
-        nc = NMRUCache(2)
-        nc.put('key1', 1)
-        nc.put('key2', 2)
-        self.assertEqual(2, nc.current_size)
-
-    def test_max_size(self):
-        nc = NMRUCache(1)
-        self.assertEqual(1, nc.max_size)
-
-    def test_hits_none(self):
-        nc = NMRUCache(1)
-        nc.get('key', object())
-        nc.get('key', object())
-        self.assertEqual(0, nc.hits)
-
-    def test_hits_some(self):
-        nc = NMRUCache(2)
-        nc.put('key', object())
-        nc.get('key', object())
-        nc.get('key', object())
-        self.assertEqual(2, nc.hits)
-
-    def test_misses(self):
-        nc = NMRUCache(1)
-        nc.get('key', object())
-        nc.get('key', object())
-        self.assertEqual(2, nc.misses)
+class TestNMRUCache(BasicCacheContract, unittest.TestCase):
 
-    def test_misses_none(self):
-        nc = NMRUCache(2)
-        nc.put('key', object())
-        nc.get('key', object())
-        nc.get('key', object())
-        self.assertEqual(0, nc.misses)
+    def make_cache(self, size):
+        return NMRUCache(size)
 
     def test_clear_with_empty_cache(self):
         nc = NMRUCache(1)
@@ -1433,34 +1345,13 @@ class TestNMRUCache(unittest.TestCase):
         self.assertEqual(0, nc.hits)
         self.assertEqual(0, nc.misses)
 
-    def test_get_key_in_cache(self):
-        nc = NMRUCache(1)
-        nc.put('key', 1)
-        out = nc.get('key', object())
-        self.assertEqual(1, out)
-
-    def test_get_key_not_in_cache(self):
-        nc = NMRUCache(1)
-        sentinel = object()
-        out = nc.get('key', sentinel)
-        self.assertEqual(sentinel, out)
-
-    def test_put_key_in_cache(self):
-        nc = NMRUCache(1)
-        nc.put('key', 1)
-        out = nc.get('key', object())
-        self.assertEqual(1, out)
-        self.assertEqual(1, nc.hits)
-        self.assertEqual(0, nc.misses)
-
-    def test_put_existing_key_in_cache(self):
-        nc = NMRUCache(1)
-        nc.put('key', 1)
-        nc.put('key', 2)
-        out = nc.get('key', object())
-        self.assertEqual(2, out)
-        self.assertEqual(1, nc.hits)
-        self.assertEqual(0, nc.misses)
+    def test_put_existing_key_not_most_recent(self):
+        nc = NMRUCache(2)
+        nc.put('key1', 1)
+        nc.put('key2', 2)
+        nc.put('key1', 3)
+        out = nc.get('key1', object())
+        self.assertEqual(3, out)
 
     def test_key_evicts_when_full(self):
         sentinel = object()
@@ -1507,58 +1398,23 @@ class TestNMRUCache(unittest.TestCase):
         self.assertEqual(2, out8)
         self.assertEqual(5, out11)
 
+    def test_key_evicts_randomly(self):
+        sentinel = object()
+        evicted = set()
+        for _ in range(100):
+            nc = NMRUCache(3)
+            nc.put('key1', 1)
+            nc.put('key2', 2)
+            nc.put('key3', 3)
+            nc.put('key4', 4)
+            evicted.update(k for k in ('key1', 'key2', 'key3') if nc.get(k, sentinel) is sentinel)
+        self.assertEqual({'key1', 'key2'}, evicted)
 
-class TestRRCache(unittest.TestCase):
-
-    def test_invalid_size(self):
-        with self.assertRaises(ValueError):
-            RRCache(0)
-
-    def test_current_size_when_empty(self):
-        rc = RRCache(1)
-        self.assertEqual(0, rc.current_size)
-
-    def test_current_size_with_items(self):
-        rc = RRCache(2)
-        rc.put('key1', 1)
-        rc.put('key2', 2)
-        self.assertEqual(2, rc.current_size)
-
-    def test_current_size_with_full_cache(self):
-        rc = RRCache(2)
-        rc.put('key1', 1)
-        rc.put('key2', 2)
-        self.assertEqual(2, rc.current_size)
-
-    def test_max_size(self):
-        rc = RRCache(1)
-        self.assertEqual(1, rc.max_size)
-
-    def test_hits_none(self):
-        rc = RRCache(1)
-        rc.get('key', object())
-        rc.get('key', object())
-        self.assertEqual(0, rc.hits)
-
-    def test_hits_some(self):
-        rc = RRCache(2)
-        rc.put('key', object())
-        rc.get('key', object())
-        rc.get('key', object())
-        self.assertEqual(2, rc.hits)
 
-    def test_misses(self):
-        rc = RRCache(1)
-        rc.get('key', object())
-        rc.get('key', object())
-        self.assertEqual(2, rc.misses)
+class TestRRCache(BasicCacheContract, unittest.TestCase):
 
-    def test_misses_none(self):
-        rc = RRCache(2)
-        rc.put('key', object())
-        rc.get('key', object())
-        rc.get('key', object())
-        self.assertEqual(0, rc.misses)
+    def make_cache(self, size):
+        return RRCache(size)
 
     def test_clear_with_empty_cache(self):
         rc = RRCache(1)
@@ -1576,35 +1432,6 @@ class TestRRCache(unittest.TestCase):
         self.assertEqual(0, rc.hits)
         self.assertEqual(0, rc.misses)
 
-    def test_get_key_in_cache(self):
-        rc = RRCache(1)
-        rc.put('key', 1)
-        out = rc.get('key', object())
-        self.assertEqual(1, out)
-
-    def test_get_key_not_in_cache(self):
-        rc = RRCache(1)
-        sentinel = object()
-        out = rc.get('key', sentinel)
-        self.assertEqual(sentinel, out)
-
-    def test_put_key_in_cache(self):
-        rc = RRCache(1)
-        rc.put('key', 1)
-        out = rc.get('key', object())
-        self.assertEqual(1, out)
-        self.assertEqual(1, rc.hits)
-        self.assertEqual(0, rc.misses)
-
-    def test_put_existing_key_in_cache(self):
-        rc = RRCache(1)
-        rc.put('key', 1)
-        rc.put('key', 2)
-        out = rc.get('key', object())
-        self.assertEqual(2, out)
-        self.assertEqual(1, rc.hits)
-        self.assertEqual(0, rc.misses)
-
     def test_key_evicts_when_full(self):
         sentinel = object()
         rc = RRCache(1)
@@ -1616,6 +1443,17 @@ class TestRRCache(unittest.TestCase):
         if len({1, 2, sentinel}.difference({out1, out2})) != 1:
             self.fail('Unexpected number of keys in cache!')
 
+    def test_key_evicts_randomly(self):
+        sentinel = object()
+        evicted = set()
+        for _ in range(100):
+            rc = RRCache(2)
+            rc.put('key1', 1)
+            rc.put('key2', 2)
+            rc.put('key3', 3)
+            evicted.update(k for k in ('key1', 'key2') if rc.get(k, sentinel) is sentinel)
+        self.assertEqual({'key1', 'key2'}, evicted)
+
 
 class TestSLRUCache(unittest.TestCase):
 
@@ -1692,8 +1530,6 @@ class TestSLRUCache(unittest.TestCase):
         sc.clear()
         self.assertEqual({}, sc._protected_map)
         self.assertEqual({}, sc._probationary_map)
-        self.assertEqual(0, len(sc._protected_store))
-        self.assertEqual(0, len(sc._probationary_store))
         self.assertEqual(0, sc.hits)
         self.assertEqual(0, sc.misses)
 
@@ -1704,8 +1540,6 @@ class TestSLRUCache(unittest.TestCase):
         sc.clear()
         self.assertEqual({}, sc._protected_map)
         self.assertEqual({}, sc._probationary_map)
-        self.assertEqual(0, len(sc._protected_store))
-        self.assertEqual(0, len(sc._probationary_store))
         self.assertEqual(0, sc.hits)
         self.assertEqual(0, sc.misses)
 
@@ -1943,7 +1777,6 @@ class TestTLRUCache(unittest.TestCase):
         tc = TLRUCache(1, 2)
         tc.clear()
         self.assertEqual({}, tc._map)
-        self.assertEqual(0, tc._queue.size)
         self.assertEqual(0, tc._access_queue.size)
         self.assertEqual(0, tc.hits)
         self.assertEqual(0, tc.misses)
@@ -2044,6 +1877,16 @@ class TestTLRUCache(unittest.TestCase):
         self.assertEqual(sentinel, out1)
         self.assertEqual(2, out2)
 
+    def test_key_evicts_by_monotonic_time(self):
+        sentinel = object()
+        tc = TLRUCache(5)
+        with patch('cachme.monotonic', side_effect=[100, 104, 110]):
+            tc.put('key1', 1)
+            out1 = tc.get('key1', sentinel)
+            out2 = tc.get('key1', sentinel)
+        self.assertEqual(1, out1)
+        self.assertEqual(sentinel, out2)
+
 
 class TestTwoQCache(unittest.TestCase):
 
@@ -2120,8 +1963,6 @@ class TestTwoQCache(unittest.TestCase):
         tc.clear()
         self.assertEqual({}, tc._primary_map)
         self.assertEqual({}, tc._secondary_map)
-        self.assertEqual(0, len(tc._primary_store))
-        self.assertEqual(0, len(tc._secondary_store))
         self.assertEqual(0, tc.hits)
         self.assertEqual(0, tc.misses)
 
@@ -2132,8 +1973,6 @@ class TestTwoQCache(unittest.TestCase):
         tc.clear()
         self.assertEqual({}, tc._primary_map)
         self.assertEqual({}, tc._secondary_map)
-        self.assertEqual(0, len(tc._primary_store))
-        self.assertEqual(0, len(tc._secondary_store))
         self.assertEqual(0, tc.hits)
         self.assertEqual(0, tc.misses)
 
@@ -2278,9 +2117,6 @@ class TestTwoQFullCache(unittest.TestCase):
         self.assertEqual({}, tc._primary_map)
         self.assertEqual({}, tc._secondary_in_map)
         self.assertEqual({}, tc._secondary_out_map)
-        self.assertEqual(0, len(tc._primary_store))
-        self.assertEqual(0, len(tc._secondary_in_store))
-        self.assertEqual(0, len(tc._secondary_out_store))
         self.assertEqual(0, tc.hits)
         self.assertEqual(0, tc.misses)
 
@@ -2292,9 +2128,6 @@ class TestTwoQFullCache(unittest.TestCase):
         self.assertEqual({}, tc._primary_map)
         self.assertEqual({}, tc._secondary_in_map)
         self.assertEqual({}, tc._secondary_out_map)
-        self.assertEqual(0, len(tc._primary_store))
-        self.assertEqual(0, len(tc._secondary_in_store))
-        self.assertEqual(0, len(tc._secondary_out_store))
         self.assertEqual(0, tc.hits)
         self.assertEqual(0, tc.misses)
 